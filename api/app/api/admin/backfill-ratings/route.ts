@@ -33,18 +33,29 @@ export async function POST(request: NextRequest) {
     // the paginated contract is exposed here (see docs/BACKFILL.md).
     const { jobs } = await jobStore.listJobs({ limit: 200 });
 
-    for (const job of jobs) {
-      if (!job) continue;
+    const candidates = jobs.filter((job) => {
+      if (!job) return false;
+      if (job.status !== 'COMPLETED' && !isJobStuck(job)) return false;
+      return Array.isArray(job.deckIds) && job.deckIds.length === 4;
+    });
 
-      const isCompleted = job.status === 'COMPLETED';
-      const isStuckRunning = isJobStuck(job);
+    // Idempotency probes are independent reads, so issue them together
+    // rather than paying one store round trip per job before any work starts.
+    const ratedChecks = await Promise.allSettled(
+      candidates.map((job) => store.hasMatchResultsForJob(job.id))
+    );
 
-      if (!isCompleted && !isStuckRunning) continue;
-      if (!Array.isArray(job.deckIds) || job.deckIds.length !== 4) continue;
+    // Rating updates are read-modify-write on shared per-deck counters,
+    // so the jobs themselves are still processed one at a time.
+    for (const [i, job] of candidates.entries()) {
+      const isStuckRunning = isJobStuck(job);
+      const ratedCheck = ratedChecks[i]!;
 
       try {
+        if (ratedCheck.status === 'rejected') throw ratedCheck.reason;
+
         // Idempotency: skip if already rated
-        if (await store.hasMatchResultsForJob(job.id)) {
+        if (ratedCheck.value) {
           skipped.push(job.id);
           continue;
         }
@@ -34,19 +34,12 @@ export async function PATCH(request: NextRequest, { params }: RouteParams) {
     if (!parsed.success) {
       return NextResponse.json({ error: parsed.error }, { status: 400 });
     }
-    const { state, workerId, workerName, durationMs, errorMessage, winner, winningTurn, winners, winningTurns } = parsed.data;
+    const { state, workerId, workerName } = parsed.data;
 
-    // Build update object, only including defined fields
-    const update: Record<string, unknown> = {};
-    if (state !== undefined) update.state = state;
-    if (workerId !== undefined) update.workerId = workerId;
-    if (workerName !== undefined) update.workerName = workerName;
-    if (durationMs !== undefined) update.durationMs = durationMs;
-    if (errorMessage !== undefined) update.errorMessage = errorMessage;
-    if (winner !== undefined) update.winner = winner;
-    if (winningTurn !== undefined) update.winningTurn = winningTurn;
-    if (winners !== undefined) update.winners = winners;
-    if (winningTurns !== undefined) update.winningTurns = winningTurns;
+    // zod already returns a fresh object holding only the schema's fields
+    // that were present in the body, so it is the update as-is — no need to
+    // copy it field by field.
+    const update: Record<string, unknown> = parsed.data;
 
     // Guard: validate state transitions using the simulation state machine.
     // Rejects invalid transitions (e.g., COMPLETED→RUNNING from stale Pub/Sub redeliveries).
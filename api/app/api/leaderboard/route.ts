@@ -14,7 +14,8 @@
  * Implementation notes:
  *   - The rating store's internal sort/limit is irrelevant here: we fetch all
  *     matching ratings, re-score with the Bayesian formula, then sort/slice
- *     in the route so top-N reflects the new ranking system.
+ *     in the route so top-N reflects the new ranking system. Entries are
+ *     only built for the decks that make the cut.
  *   - Reads denormalized deck metadata from rating docs (no N+1 getDeckById calls).
  *   - Falls back to getDeckById only for rating docs missing denormalized fields.
  *   - 5-minute in-memory cache + Cache-Control headers.
@@ -93,52 +94,64 @@ export async function GET(request: NextRequest) {
     // present here. Sort/slice ourselves below.
     const ratings = await store.getLeaderboard({ minGames, limit: STORE_FETCH_CAP });
 
+    // Rank on the raw rating docs first, then build response entries only
+    // for the top `limit` — the store can return up to STORE_FETCH_CAP docs,
+    // and most of them are sliced away.
+    const ranked = ratings
+      .map((r) => ({ r, score: bayesianScore(r.wins, r.gamesPlayed) }))
+      .sort((a, b) => b.score - a.score);
+
     // Build leaderboard entries using denormalized metadata when available
-    const entries = await Promise.all(
-      ratings.map(async (r): Promise<LeaderboardEntry | null> => {
-        // Use denormalized fields if present, otherwise fall back to getDeckById
-        let name = r.deckName;
-        let setName = r.setName;
-        let isPrecon = r.isPrecon;
-        let primaryCommander = r.primaryCommander;
-
-        if (!name) {
-          // Backcompat: older rating docs may not have denormalized metadata
-          const deck = await getDeckById(r.deckId);
-          if (!deck) return null;
-          name = deck.name;
-          setName = deck.setName ?? null;
-          isPrecon = deck.isPrecon;
-          primaryCommander = deck.primaryCommander ?? null;
-        }
-
-        const winTurnWins = r.winTurnWins ?? 0;
-        const hasHistogram =
-          Array.isArray(r.winTurnHistogram) &&
-          r.winTurnHistogram.length === 16 &&
-          r.winTurnHistogram.some((n) => n > 0);
-        return {
-          deckId: r.deckId,
-          name,
-          setName: setName ?? null,
-          isPrecon: isPrecon ?? false,
-          primaryCommander: primaryCommander ?? null,
-          mu: r.mu,
-          sigma: r.sigma,
-          rating: bayesianScore(r.wins, r.gamesPlayed),
-          gamesPlayed: r.gamesPlayed,
-          wins: r.wins,
-          winRate: r.gamesPlayed > 0 ? r.wins / r.gamesPlayed : 0,
-          avgWinTurn: winTurnWins > 0 ? (r.winTurnSum ?? 0) / winTurnWins : null,
-          winTurnHistogram: hasHistogram ? r.winTurnHistogram! : null,
-        };
-      }),
-    );
-
-    const validEntries = entries
-      .filter((e): e is LeaderboardEntry => e !== null)
-      .sort((a, b) => b.rating - a.rating)
-      .slice(0, limit);
+    const toEntry = async ({ r, score }: (typeof ranked)[number]): Promise<LeaderboardEntry | null> => {
+      // Use denormalized fields if present, otherwise fall back to getDeckById
+      let name = r.deckName;
+      let setName = r.setName;
+      let isPrecon = r.isPrecon;
+      let primaryCommander = r.primaryCommander;
+
+      if (!name) {
+        // Backcompat: older rating docs may not have denormalized metadata
+        const deck = await getDeckById(r.deckId);
+        if (!deck) return null;
+        name = deck.name;
+        setName = deck.setName ?? null;
+        isPrecon = deck.isPrecon;
+        primaryCommander = deck.primaryCommander ?? null;
+      }
+
+      const winTurnWins = r.winTurnWins ?? 0;
+      const hasHistogram =
+        Array.isArray(r.winTurnHistogram) &&
+        r.winTurnHistogram.length === 16 &&
+        r.winTurnHistogram.some((n) => n > 0);
+      return {
+        deckId: r.deckId,
+        name,
+        setName: setName ?? null,
+        isPrecon: isPrecon ?? false,
+        primaryCommander: primaryCommander ?? null,
+        mu: r.mu,
+        sigma: r.sigma,
+        rating: score,
+        gamesPlayed: r.gamesPlayed,
+        wins: r.wins,
+        winRate: r.gamesPlayed > 0 ? r.wins / r.gamesPlayed : 0,
+        avgWinTurn: winTurnWins > 0 ? (r.winTurnSum ?? 0) / winTurnWins : null,
+        winTurnHistogram: hasHistogram ? r.winTurnHistogram! : null,
+      };
+    };
+
+    // Decks whose metadata can't be resolved are dropped, so keep pulling
+    // from the ranking until `limit` entries are filled or it runs out.
+    const validEntries: LeaderboardEntry[] = [];
+    let next = 0;
+    while (validEntries.length < limit && next < ranked.length) {
+      const batch = ranked.slice(next, next + limit - validEntries.length);
+      next += batch.length;
+      for (const entry of await Promise.all(batch.map(toEntry))) {
+        if (entry) validEntries.push(entry);
+      }
+    }
 
     // Update cache
     cache = { data: validEntries, minGames, limit, at: now };
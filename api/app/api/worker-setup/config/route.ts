@@ -56,6 +56,20 @@ function aesEncrypt(plaintext: string, hexKey: string): { iv: string; ciphertext
   };
 }
 
+let secretClient: InstanceType<typeof import('@google-cloud/secret-manager').SecretManagerServiceClient> | null = null;
+
+/**
+ * Lazily create one Secret Manager client per process. Constructing it opens
+ * a gRPC channel and resolves credentials, which is too slow to repeat on
+ * every setup request.
+ */
+async function getSecretClient() {
+  if (secretClient) return secretClient;
+  const { SecretManagerServiceClient } = await import('@google-cloud/secret-manager');
+  secretClient = new SecretManagerServiceClient();
+  return secretClient;
+}
+
 /**
  * Read the worker-host-config from the best available source:
  * 1. WORKER_HOST_CONFIG env var (injected by Cloud Run from Secret Manager)
@@ -66,8 +80,7 @@ async function readWorkerConfig(): Promise<string> {
     return process.env.WORKER_HOST_CONFIG;
   }
 
-  const { SecretManagerServiceClient } = await import('@google-cloud/secret-manager');
-  const client = new SecretManagerServiceClient();
+  const client = await getSecretClient();
   const projectId = process.env.GOOGLE_CLOUD_PROJECT;
   const [version] = await client.accessSecretVersion({
     name: `projects/${projectId}/secrets/worker-host-config/versions/latest`,
@@ -357,8 +357,12 @@ export async function syncPrecons(): Promise<SyncResult> {
       const firestoreDecks = await import('./firestore-decks');
       const allDecks = await firestoreDecks.listAllDecks();
       const preconItems = allDecks.filter(d => d.isPrecon);
-      const gcsUrl = await uploadPreconsJson(preconItems);
-      console.log(`[PreconSync] Uploaded precons.json to GCS (${preconItems.length} precons): ${gcsUrl}`);
+      const { url: gcsUrl, uploaded } = await uploadPreconsJson(preconItems);
+      if (uploaded) {
+        console.log(`[PreconSync] Uploaded precons.json to GCS (${preconItems.length} precons): ${gcsUrl}`);
+      } else {
+        console.log(`[PreconSync] precons.json unchanged (${preconItems.length} precons), skipped upload: ${gcsUrl}`);
+      }
     } catch (err) {
       // Non-fatal: precons still available via API fallback
       console.error('[PreconSync] Failed to upload precons.json to GCS:', err);
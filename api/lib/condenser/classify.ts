@@ -49,6 +49,47 @@ import {
   EXTRACT_CMC,
 } from './patterns';
 
+/**
+ * Keywords that every KEEP pattern requires in order to match.
+ *
+ * Many Forge lines ("Mana: ...", "Resolve stack: ...") match none of the
+ * keep patterns, yet would otherwise run through every regex below before
+ * falling out as null. Lines containing none of these keywords are rejected
+ * up front with a single case-insensitive literal scan.
+ *
+ * Keep this in sync with the KEEP_* patterns in patterns.ts: each pattern
+ * must contain at least one of these keywords in every alternative, or the
+ * prefilter will hide lines it should match.
+ */
+const CLASSIFY_KEYWORDS = [
+  'win',       // KEEP_WIN_CONDITION (wins, winner)
+  'game',      // KEEP_WIN_CONDITION (game over, loses the game)
+  'life',      // KEEP_LIFE_CHANGE
+  'graveyard', // KEEP_ZONE_CHANGE_GY_BF
+  'cast',      // KEEP_SPELL_HIGH_CMC, KEEP_COMMANDER_CAST, KEEP_SPELL_CAST
+  'cmc',       // KEEP_SPELL_HIGH_CMC (bare "CMC 7")
+  'command',   // KEEP_COMMANDER_CAST (from command zone)
+  'draw',      // KEEP_EXTRA_DRAW
+  'attack',    // KEEP_COMBAT
+  'combat',    // KEEP_COMBAT
+  'land:',     // KEEP_LAND_PLAYED
+];
+
+/**
+ * One alternation over all keywords. Matching it case-insensitively avoids
+ * lowercasing a copy of every line just to run substring checks.
+ */
+const CLASSIFY_KEYWORD_PATTERN = new RegExp(CLASSIFY_KEYWORDS.join('|'), 'i');
+
+/**
+ * Checks the first parenthesized number on a line, "(CMC N)" or "(N)", for a
+ * mana value of 5 or more.
+ */
+function highCmcFromParens(line: string): boolean {
+  const cmcMatch = EXTRACT_CMC.exec(line);
+  return cmcMatch !== null && parseInt(cmcMatch[1], 10) >= 5;
+}
+
 /**
  * Classifies a single log line into an event type.
  *
@@ -65,6 +106,16 @@ import {
  * classifyLine("Turn 3: Player B")               // null (turn markers aren't events)
  */
 export function classifyLine(line: string): EventType | null {
+  // -------------------------------------------------------------------------
+  // Cheap reject
+  // -------------------------------------------------------------------------
+  // Lines with none of the keywords can't match any keep pattern. The only
+  // check left for them is the parenthesized-CMC fallback (Priority 4),
+  // which has no keyword of its own.
+  if (!CLASSIFY_KEYWORD_PATTERN.test(line)) {
+    return highCmcFromParens(line) ? 'spell_cast_high_cmc' : null;
+  }
+
   // -------------------------------------------------------------------------
   // Priority 1: Win Condition
   // -------------------------------------------------------------------------
@@ -106,12 +157,8 @@ export function classifyLine(line: string): EventType | null {
   }
 
   // Also check for CMC in parentheses that the main pattern might miss
-  const cmcMatch = EXTRACT_CMC.exec(line);
-  if (cmcMatch) {
-    const cmc = parseInt(cmcMatch[1], 10);
-    if (cmc >= 5) {
-      return 'spell_cast_high_cmc';
-    }
+  if (highCmcFromParens(line)) {
+    return 'spell_cast_high_cmc';
   }
 
   // -------------------------------------------------------------------------
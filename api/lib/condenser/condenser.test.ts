@@ -7,8 +7,10 @@
 import * as fs from 'fs';
 import * as path from 'path';
 import { condenseGame, condenseGames } from './index';
+import type { CondensedGame } from '../types';
 import { extractWinner, extractWinningTurn, getNumPlayers, extractTurnRanges, calculatePerDeckTurns } from './turns';
 import { splitConcatenatedGames } from './patterns';
+import { classifyLine } from './classify';
 import { matchesDeckName } from './deck-match';
 
 // ---------------------------------------------------------------------------
@@ -65,17 +67,27 @@ async function runTests() {
 
   const rawLog = loadFixture();
 
+  // Split and condense the fixture once up front. Tests only read these, so
+  // sharing them saves re-running the pipeline in every test. Building them
+  // inside test() reports a pipeline error as a failure instead of aborting
+  // the run.
+  let games: string[] = [];
+  let condensedGames: CondensedGame[] = [];
+
+  await test('setup: split and condense the 4-game fixture', () => {
+    games = splitConcatenatedGames(rawLog);
+    condensedGames = condenseGames(games);
+  });
+
   // =========================================================================
   // splitConcatenatedGames
   // =========================================================================
 
   await test('splitConcatenatedGames: splits 4-game log into 4 individual games', () => {
-    const games = splitConcatenatedGames(rawLog);
     assertEqual(games.length, 4, 'game count');
   });
 
   await test('splitConcatenatedGames: each game has a valid winner', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
       const winner = extractWinner(games[i]);
       assert(winner !== undefined && winner.length > 0, `Game ${i + 1} should have a winner, got "${winner}"`);
@@ -104,21 +116,18 @@ async function runTests() {
   // =========================================================================
 
   await test('extractWinner: correct winner from game 1', () => {
-    const games = splitConcatenatedGames(rawLog);
     const winner = extractWinner(games[0]);
     assert(winner !== undefined, 'game 1 should have a winner');
     assert(winner!.includes('Explorers of the Deep'), `Expected Explorers of the Deep, got "${winner}"`);
   });
 
   await test('extractWinner: correct winner from game 2', () => {
-    const games = splitConcatenatedGames(rawLog);
     const winner = extractWinner(games[1]);
     assert(winner !== undefined, 'game 2 should have a winner');
     assert(winner!.includes('Doran Big Butts'), `Expected Doran Big Butts, got "${winner}"`);
   });
 
   await test('extractWinner: correct winners across all 4 games', () => {
-    const games = splitConcatenatedGames(rawLog);
     const winners = games.map(g => extractWinner(g));
     assert(winners[0]!.includes('Explorers of the Deep'), `Game 1 winner: ${winners[0]}`);
     assert(winners[1]!.includes('Doran Big Butts'), `Game 2 winner: ${winners[1]}`);
@@ -132,12 +141,18 @@ async function runTests() {
     assertEqual(winner, undefined, 'no-winner log');
   });
 
+  await test('extractWinner: name on the line before the win phrase is still captured', () => {
+    // The name capture stops at a line break but the whitespace before the
+    // phrase doesn't, so the match can start a line above the phrase.
+    assertEqual(extractWinner('Turn 1: A\nAi(2)-Deck\n  wins the game.'), 'Ai(2)-Deck', 'phrase on next line');
+    assertEqual(extractWinner('Bob wins the gamey\nAlice has won!'), 'Alice', 'first valid phrase wins');
+  });
+
   // =========================================================================
   // extractWinningTurn
   // =========================================================================
 
   await test('extractWinningTurn: returns a positive round number from real game', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
       const turn = extractWinningTurn(games[i]);
       assert(turn !== undefined && turn > 0, `Game ${i + 1} winning turn should be > 0, got ${turn}`);
@@ -155,7 +170,6 @@ async function runTests() {
   // =========================================================================
 
   await test('condenseGame: produces valid condensed output from a real game', () => {
-    const games = splitConcatenatedGames(rawLog);
     const condensed = condenseGame(games[0]);
 
     assert(condensed.turnCount > 0, `turnCount should be > 0, got ${condensed.turnCount}`);
@@ -165,8 +179,7 @@ async function runTests() {
   });
 
   await test('condenseGame: keptEvents contain expected event types', () => {
-    const games = splitConcatenatedGames(rawLog);
-    const condensed = condenseGame(games[0]);
+    const condensed = condensedGames[0];
     const types = new Set(condensed.keptEvents.map(e => e.type));
 
     // A real Commander game should have spells, lands, combat, and life changes
@@ -177,19 +190,55 @@ async function runTests() {
   });
 
   await test('condenseGame: manaPerTurn has entries', () => {
-    const games = splitConcatenatedGames(rawLog);
-    const condensed = condenseGame(games[0]);
+    const condensed = condensedGames[0];
     const turns = Object.keys(condensed.manaPerTurn);
     assert(turns.length > 0, 'manaPerTurn should have entries');
   });
 
+  await test('condenseGame: mana and draw phrases wrapped across lines are still counted', () => {
+    // Metrics are counted over each turn segment's whole text, so a phrase
+    // split by a line break counts the same as it would on one line.
+    const log = 'Turn: Turn 1 (Ai(1)-A)\nX taps Forest\nfor G\nAi(1)-A draws\n2 cards\n';
+    const condensed = condenseGame(log);
+    assertEqual(condensed.manaPerTurn[1]?.manaEvents, 1, 'taps X\\nfor');
+    assertEqual(condensed.cardsDrawnPerTurn[1], 2, 'draws\\nN cards');
+  });
+
+  // =========================================================================
+  // classifyLine keyword prefilter
+  // =========================================================================
+
+  await test('classifyLine: lines without any keep keyword are rejected', () => {
+    assertEqual(classifyLine('Resolve stack: Arboreal Grazer - Creature 0 / 3'), null, 'resolve stack');
+    assertEqual(classifyLine('Phase: Ai(1)-Doran Big Butts\' Upkeep step'), null, 'phase line');
+  });
+
+  await test('classifyLine: keyword lines still reach their patterns', () => {
+    assertEqual(classifyLine('Player A wins the game.'), 'win_condition', 'win');
+    assertEqual(classifyLine('[LIFE] Life: Ai(1)-Doran Big Butts 40 -> 37'), 'life_change', 'life');
+    assertEqual(classifyLine('Return target creature from graveyard to battlefield'), 'zone_change_gy_to_bf', 'zone');
+    assertEqual(classifyLine('Player A casts Sol Ring.'), 'spell_cast', 'cast');
+    assertEqual(classifyLine('Land: Ai(1)-Doran Big Butts played Forest (41)'), 'land_played', 'land');
+  });
+
+  await test('classifyLine: priority wins over position when several rules match', () => {
+    // "casts" appears before "wins the game", but win_condition has priority
+    assertEqual(classifyLine('Player A casts Approach, then wins the game.'), 'win_condition', 'win over cast');
+    // "(2)" comes first, so the parenthesized CMC fallback doesn't fire
+    assertEqual(classifyLine('Ai(2)-Deck attacks with Dragon (12)'), 'combat', 'first paren decides CMC');
+  });
+
+  await test('classifyLine: parenthesized CMC fallback applies to keyword-free lines', () => {
+    assertEqual(classifyLine('Mana: Forest (287) - {T}: Add {G}.'), 'spell_cast_high_cmc', 'paren >= 5');
+    assertEqual(classifyLine('Mana: Forest (3) - {T}: Add {G}.'), null, 'paren < 5');
+  });
+
   // =========================================================================
   // condenseGames (batch)
   // =========================================================================
 
   await test('condenseGames: processes all 4 games', () => {
-    const games = splitConcatenatedGames(rawLog);
-    const condensed = condenseGames(games);
+    const condensed = condensedGames;
     assertEqual(condensed.length, 4, 'should condense all 4 games');
     for (let i = 0; i < condensed.length; i++) {
       assert(condensed[i].turnCount > 0, `Game ${i + 1} should have turns`);
@@ -197,8 +246,7 @@ async function runTests() {
   });
 
   await test('condenseGames: win counts across 4 games match expected', () => {
-    const games = splitConcatenatedGames(rawLog);
-    const condensed = condenseGames(games);
+    const condensed = condensedGames;
 
     // From the fixture: Explorers=1, Doran=1, Enduring=2
     // Winners are in "Game outcome: Ai(N)-DeckName" format - use endsWith matching
@@ -225,7 +273,6 @@ async function runTests() {
   // =========================================================================
 
   await test('getNumPlayers: returns 4 for a 4-player Commander game', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
       const ranges = extractTurnRanges(games[i]);
       const numPlayers = getNumPlayers(ranges);
@@ -238,7 +285,6 @@ async function runTests() {
   // =========================================================================
 
   await test('extractWinningTurn: returns personal turn counts <= 20, not raw segments', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
       const turn = extractWinningTurn(games[i]);
       assert(turn !== undefined, `Game ${i + 1} should have a winning turn`);
@@ -251,7 +297,6 @@ async function runTests() {
   // =========================================================================
 
   await test('extractWinner: does not contain "Game outcome:" prefix', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
       const winner = extractWinner(games[i]);
       assert(winner !== undefined, `Game ${i + 1} should have a winner`);
@@ -284,7 +329,6 @@ async function runTests() {
   const expectedWinnerTurns = [11, 11, 16, 9];
 
   await test('calculatePerDeckTurns: Game 1 exact per-deck turn counts', () => {
-    const games = splitConcatenatedGames(rawLog);
     const ranges = extractTurnRanges(games[0]);
     const perDeck = calculatePerDeckTurns(ranges);
     for (const [deckName, expected] of Object.entries(expectedPerDeckTurns[0])) {
@@ -295,7 +339,6 @@ async function runTests() {
   });
 
   await test('calculatePerDeckTurns: Game 2 exact per-deck turn counts', () => {
-    const games = splitConcatenatedGames(rawLog);
     const ranges = extractTurnRanges(games[1]);
     const perDeck = calculatePerDeckTurns(ranges);
     for (const [deckName, expected] of Object.entries(expectedPerDeckTurns[1])) {
@@ -306,7 +349,6 @@ async function runTests() {
   });
 
   await test('calculatePerDeckTurns: Game 3 exact per-deck turn counts', () => {
-    const games = splitConcatenatedGames(rawLog);
     const ranges = extractTurnRanges(games[2]);
     const perDeck = calculatePerDeckTurns(ranges);
     for (const [deckName, expected] of Object.entries(expectedPerDeckTurns[2])) {
@@ -317,7 +359,6 @@ async function runTests() {
   });
 
   await test('calculatePerDeckTurns: Game 4 exact per-deck turn counts', () => {
-    const games = splitConcatenatedGames(rawLog);
     const ranges = extractTurnRanges(games[3]);
     const perDeck = calculatePerDeckTurns(ranges);
     for (const [deckName, expected] of Object.entries(expectedPerDeckTurns[3])) {
@@ -328,7 +369,6 @@ async function runTests() {
   });
 
   await test('calculatePerDeckTurns: each game has 4 decks', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
       const ranges = extractTurnRanges(games[i]);
       const perDeck = calculatePerDeckTurns(ranges);
@@ -337,25 +377,22 @@ async function runTests() {
   });
 
   await test('condenseGame: turnCount equals winner personal turn count', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
-      const condensed = condenseGame(games[i]);
+      const condensed = condensedGames[i];
       assertEqual(condensed.turnCount, expectedWinnerTurns[i], `Game ${i + 1} turnCount should be winner's personal turn count`);
     }
   });
 
   await test('condenseGame: winningTurn equals turnCount for all 4 games', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
-      const condensed = condenseGame(games[i]);
+      const condensed = condensedGames[i];
       assertEqual(condensed.winningTurn, condensed.turnCount, `Game ${i + 1} winningTurn should equal turnCount`);
     }
   });
 
   await test('condenseGame: perDeckTurns is populated with 4 decks per game', () => {
-    const games = splitConcatenatedGames(rawLog);
     for (let i = 0; i < games.length; i++) {
-      const condensed = condenseGame(games[i]);
+      const condensed = condensedGames[i];
       assert(condensed.perDeckTurns !== undefined, `Game ${i + 1} should have perDeckTurns`);
       assertEqual(Object.keys(condensed.perDeckTurns!).length, 4, `Game ${i + 1} perDeckTurns deck count`);
     }
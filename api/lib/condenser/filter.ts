@@ -29,10 +29,18 @@
 
 import {
   IGNORE_PATTERNS,
+  IGNORE_PRIORITY_PASS,
+  IGNORE_UNTAP_STEP,
   IGNORE_DRAW_STEP,
   KEEP_EXTRA_DRAW,
 } from './patterns';
 
+/**
+ * Every IGNORE pattern as one alternation. A line matches this exactly when
+ * it matches at least one of IGNORE_PATTERNS.
+ */
+const IGNORE_ANY = new RegExp(IGNORE_PATTERNS.map((p) => `(?:${p.source})`).join('|'), 'i');
+
 /**
  * Determines if a log line should be filtered out (ignored).
  *
@@ -58,34 +66,33 @@ export function shouldIgnoreLine(line: string): boolean {
   // -------------------------------------------------------------------------
   // Step 2: Check against ignore patterns
   // -------------------------------------------------------------------------
-  // We iterate through all ignore patterns. If any match, we (usually) ignore.
-  for (const pattern of IGNORE_PATTERNS) {
-    if (pattern.test(trimmed)) {
-      // -----------------------------------------------------------------------
-      // Special case: Draw step with extra card draw
-      // -----------------------------------------------------------------------
-      // The IGNORE_DRAW_STEP pattern would filter out "Draw step." lines.
-      // But if the line also mentions extra draws (e.g., "draws 3 cards"),
-      // we want to KEEP it because extra card draw is significant.
-      //
-      // We check if this is the draw step pattern AND if extra draw is present.
-      if (pattern === IGNORE_DRAW_STEP || pattern.source.includes('draw')) {
-        if (KEEP_EXTRA_DRAW.test(trimmed)) {
-          // This line has extra card draw info - DON'T ignore it!
-          return false;
-        }
-      }
-
-      // Pattern matched and no exception applies - ignore this line
-      return true;
-    }
+  // One combined test for all ignore patterns. Most lines are kept, so for
+  // them this is the only regex call.
+  if (!IGNORE_ANY.test(trimmed)) {
+    return false;
   }
 
   // -------------------------------------------------------------------------
-  // Step 3: Line didn't match any ignore pattern
+  // Special case: Draw step with extra card draw
   // -------------------------------------------------------------------------
-  // This line might be significant. Return false so it proceeds to classification.
-  return false;
+  // The IGNORE_DRAW_STEP pattern would filter out "Draw step." lines.
+  // But if the line also mentions extra draws (e.g., "draws 3 cards"),
+  // we want to KEEP it because extra card draw is significant.
+  //
+  // Patterns are checked in priority order, so the exception only applies
+  // when the draw step is the first ignore pattern the line hits.
+  if (
+    IGNORE_DRAW_STEP.test(trimmed) &&
+    !IGNORE_PRIORITY_PASS.test(trimmed) &&
+    !IGNORE_UNTAP_STEP.test(trimmed) &&
+    KEEP_EXTRA_DRAW.test(trimmed)
+  ) {
+    // This line has extra card draw info - DON'T ignore it!
+    return false;
+  }
+
+  // Pattern matched and no exception applies - ignore this line
+  return true;
 }
 
 /**
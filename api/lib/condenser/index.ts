@@ -15,34 +15,28 @@
  *    │
  *    ▼
  * ┌─────────────────────────────────────────────────────────────────────────┐
- * │ STEP 1: SPLIT & FILTER (filter.ts)                                     │
- * │   - Split into lines                                                   │
- * │   - Remove noise (priority passes, phase markers, empty lines)         │
- * │   - Special case: Keep draw step if extra cards drawn                  │
+ * │ STEPS 1-3: ONE WALK OVER THE LINES (filter.ts, classify.ts, turns.ts)   │
+ * │   For each line of the log, in a single pass:                           │
+ * │   - Turn marker ("Turn N: Player X")? Open a new turn segment           │
+ * │   - Drop noise (priority passes, phase markers, empty lines)            │
+ * │   - Classify survivors into an event type                               │
+ * │     Priority: win > life > zone_change > high_cmc > commander > ...     │
+ * │   Then count mana and draw events over each segment's ORIGINAL text     │
+ * │   (before noise filtering) and fold the counts into rounds              │
  * └─────────────────────────────────────────────────────────────────────────┘
  *    │
  *    ▼
  * ┌─────────────────────────────────────────────────────────────────────────┐
- * │ STEP 2: CLASSIFY (classify.ts)                                         │
- * │   - Categorize each line into an event type                            │
- * │   - Priority: win > life > zone_change > high_cmc > commander > ...    │
- * │   - Discard lines that don't match any "keep" pattern                  │
+ * │ STEP 4: DETECT WINNER & PER-DECK TURNS (turns.ts)                       │
+ * │   - Detect winner and winning turn                                      │
+ * │   - Count turns taken by each deck                                      │
  * └─────────────────────────────────────────────────────────────────────────┘
  *    │
  *    ▼
  * ┌─────────────────────────────────────────────────────────────────────────┐
- * │ STEP 3: EXTRACT TURNS & METRICS (turns.ts)                             │
- * │   - Find turn boundaries ("Turn N: Player X")                          │
- * │   - Calculate mana events per turn                                     │
- * │   - Calculate cards drawn per turn                                     │
- * │   - Detect winner and winning turn                                     │
- * └─────────────────────────────────────────────────────────────────────────┘
- *    │
- *    ▼
- * ┌─────────────────────────────────────────────────────────────────────────┐
- * │ STEP 4: BUILD CONDENSED OUTPUT                                         │
- * │   - Assemble all pieces into CondensedGame object                      │
- * │   - This is what gets sent to the Analysis Service                     │
+ * │ STEP 5: BUILD CONDENSED OUTPUT                                          │
+ * │   - Assemble all pieces into CondensedGame object                       │
+ * │   - This is what gets sent to the Analysis Service                      │
  * └─────────────────────────────────────────────────────────────────────────┘
  *    │
  *    ▼
@@ -64,15 +58,18 @@
  * =============================================================================
  */
 
-import type { CondensedGame, StructuredGame } from '../types';
-import { splitAndFilter } from './filter';
-import { classifyLines } from './classify';
+import type { CondensedGame, GameEvent, StructuredGame, TurnManaInfo } from '../types';
+import { shouldIgnoreLine } from './filter';
+import { createEvent } from './classify';
 import {
-  extractTurnRanges,
+  type TurnRange,
+  parseTurnLine,
   getNumPlayers,
   getMaxRound,
-  calculateManaPerTurn,
-  calculateCardsDrawnPerTurn,
+  segmentToRound,
+  sliceByTurn,
+  countManaEvents,
+  countCardsDrawn,
   calculatePerDeckTurns,
   extractWinner,
 } from './turns';
@@ -107,35 +104,74 @@ export * from './patterns';
  */
 export function condenseGame(rawLog: string): CondensedGame {
   // ===========================================================================
-  // STEP 1: FILTER
+  // STEPS 1-3: FILTER, CLASSIFY & COUNT (single pass)
   // ===========================================================================
-  // Remove noise lines (priority passes, phase markers, etc.)
-  // This typically reduces log size by ~80%.
+  // Walk the log once. Each line is:
+  //   - checked for a turn marker, which opens a new turn segment
+  //   - filtered for noise and, if it survives, classified into an event
+  //
+  // Mana and draw metrics are then counted over each turn segment's whole
+  // text, the ORIGINAL lines (mana and draw text often appears in lines the
+  // noise filter drops). Counting per segment rather than per line keeps
+  // phrases that wrap across a line break ("draws\n2 cards") counted.
+  //
+  // Lines before the first turn marker (deck loading, mulligans) produce
+  // events but don't count toward any turn's metrics.
 
-  const filteredLines = splitAndFilter(rawLog);
+  // Forge writes LF logs, so only pay for the two full-log rewrites when a
+  // CR is actually present.
+  const normalized = rawLog.includes('\r')
+    ? rawLog.replace(/\r\n/g, '\n').replace(/\r/g, '\n')
+    : rawLog;
 
-  // ===========================================================================
-  // STEP 2: CLASSIFY
-  // ===========================================================================
-  // Categorize remaining lines into event types (life_change, spell_cast, etc.)
-  // Lines that don't match any pattern are discarded here.
+  const keptEvents: GameEvent[] = [];
+  const turnRanges: TurnRange[] = [];
 
-  const keptEvents = classifyLines(filteredLines);
+  // Walk line boundaries with indexOf rather than split('\n'), so only the
+  // current line is live instead of an array holding every line of the log.
+  let offset = 0;
+  while (offset <= normalized.length) {
+    let end = normalized.indexOf('\n', offset);
+    if (end === -1) end = normalized.length;
+    const line = normalized.slice(offset, end);
 
-  // ===========================================================================
-  // STEP 3: EXTRACT METRICS (round-based)
-  // ===========================================================================
-  // Calculate per-round statistics from the ORIGINAL log (not filtered).
-  // We use the original because metric patterns (mana, draw) may appear
-  // in lines that were filtered for event purposes.
-  //
-  // A "round" is one full rotation where each player takes a turn.
-  // In a 4-player Commander game, round 1 = segments 1-4, round 2 = segments 5-8, etc.
+    // Cheap first-character check ('T' or 't') before the turn regex
+    if ((line.charCodeAt(0) | 0x20) === 0x74) {
+      const range = parseTurnLine(line, offset);
+      if (range) {
+        turnRanges.push(range);
+      }
+    }
+
+    if (!shouldIgnoreLine(line)) {
+      const event = createEvent(line);
+      if (event !== null) {
+        keptEvents.push(event);
+      }
+    }
 
-  const turnRanges = extractTurnRanges(rawLog);
+    offset = end + 1;
+  }
+
+  // Count each segment and fold the counts into rounds. A "round" is one full
+  // rotation where each player takes a turn: in a 4-player Commander game,
+  // round 1 = segments 1-4, round 2 = segments 5-8, etc.
   const numPlayers = getNumPlayers(turnRanges);
-  const manaPerTurn = calculateManaPerTurn(rawLog, numPlayers);
-  const cardsDrawnPerTurn = calculateCardsDrawnPerTurn(rawLog, numPlayers);
+  const manaPerTurn: Record<number, TurnManaInfo> = {};
+  const cardsDrawnPerTurn: Record<number, number> = {};
+
+  for (const { turnNumber, chunk } of sliceByTurn(normalized, turnRanges)) {
+    const round = segmentToRound(turnNumber, numPlayers);
+    const manaEvents = countManaEvents(chunk);
+    const cardsDrawn = countCardsDrawn(chunk);
+    if (manaPerTurn[round]) {
+      manaPerTurn[round].manaEvents += manaEvents;
+      cardsDrawnPerTurn[round] += cardsDrawn;
+    } else {
+      manaPerTurn[round] = { manaEvents };
+      cardsDrawnPerTurn[round] = cardsDrawn;
+    }
+  }
 
   // ===========================================================================
   // STEP 4: DETECT WINNER & PER-DECK TURNS
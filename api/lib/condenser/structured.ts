@@ -30,7 +30,7 @@
  */
 
 import type { StructuredGame, DeckHistory, DeckTurnActions, DeckAction, EventType } from '../types';
-import { extractTurnRanges, sliceByTurn, getMaxRound, getNumPlayers, segmentToRound, calculateLifePerTurn, calculatePerDeckTurns, extractWinner } from './turns';
+import { type TurnRange, extractTurnRanges, sliceByTurn, getMaxRound, getNumPlayers, segmentToRound, calculateLifePerTurn, calculatePerDeckTurns, extractWinner } from './turns';
 import { classifyLine } from './classify';
 import { matchesDeckName } from './deck-match';
 
@@ -38,6 +38,9 @@ import { matchesDeckName } from './deck-match';
 // Player Attribution
 // -----------------------------------------------------------------------------
 
+/** A "Turn N..." marker line, which attributeLines drops from the output. */
+const TURN_MARKER_LINE = /^Turn\s+\d+/i;
+
 /**
  * Represents a line with its attributed player and turn.
  */
@@ -59,11 +62,13 @@ interface AttributedLine {
  * turn marker.
  *
  * @param rawLog - The complete raw log text
+ * @param turnRanges - Optional pre-computed ranges from extractTurnRanges(rawLog),
+ *                     so callers that already have them skip a second scan
  * @returns Array of attributed lines
  */
-export function attributeLines(rawLog: string): AttributedLine[] {
+export function attributeLines(rawLog: string, turnRanges?: TurnRange[]): AttributedLine[] {
   const attributed: AttributedLine[] = [];
-  const ranges = extractTurnRanges(rawLog);
+  const ranges = turnRanges ?? extractTurnRanges(rawLog);
 
   if (ranges.length === 0) {
     // No turn markers found - return all lines as turn 0, unknown player
@@ -94,8 +99,9 @@ export function attributeLines(rawLog: string): AttributedLine[] {
       const trimmed = line.trim();
       if (!trimmed) continue;
 
-      // Skip the turn marker line itself (it just says "Turn N: Player X")
-      if (/^Turn\s+\d+/i.test(trimmed)) continue;
+      // Skip the turn marker line itself (it just says "Turn N: Player X").
+      // Cheap first-character check ('T' or 't') before the regex.
+      if ((trimmed.charCodeAt(0) | 0x20) === 0x74 && TURN_MARKER_LINE.test(trimmed)) continue;
 
       attributed.push({
         line: trimmed,
@@ -130,7 +136,7 @@ export function buildStructuredGame(
 ): StructuredGame {
   const normalized = rawLog.replace(/\r\n/g, '\n').replace(/\r/g, '\n');
   const ranges = extractTurnRanges(normalized);
-  const attributedLines = attributeLines(normalized);
+  const attributedLines = attributeLines(normalized, ranges);
   
   // Determine number of players and calculate round-based total turns
   const numPlayers = getNumPlayers(ranges);
@@ -257,7 +263,7 @@ export function buildStructuredGame(
   // -------------------------------------------------------------------------
   // Step 4: Calculate life totals per round
   // -------------------------------------------------------------------------
-  const lifePerTurn = calculateLifePerTurn(normalized, players, numPlayers);
+  const lifePerTurn = calculateLifePerTurn(normalized, players, numPlayers, ranges);
 
   // -------------------------------------------------------------------------
   // Step 5: Per-deck turns, winner, and winning turn
@@ -39,6 +39,16 @@ import {
 } from './patterns';
 import { matchesDeckName } from './deck-match';
 
+// Global-flag copies of the extraction patterns, compiled once at module load
+// instead of on every chunk. Loops that drive these with exec() reset
+// lastIndex first, since the objects are shared across calls.
+const TURN_NUMBER_GLOBAL = new RegExp(EXTRACT_TURN_NUMBER.source, 'gim');
+const TURN_NUMBER_LINE = new RegExp(EXTRACT_TURN_NUMBER.source, 'i');
+const MANA_PRODUCED_GLOBAL = new RegExp(EXTRACT_MANA_PRODUCED.source, 'gi');
+const TAP_FOR_GLOBAL = new RegExp(EXTRACT_TAP_FOR.source, 'gi');
+const DRAW_MULTIPLE_GLOBAL = new RegExp(EXTRACT_DRAW_MULTIPLE.source, 'gi');
+const DRAW_SINGLE_GLOBAL = new RegExp(EXTRACT_DRAW_SINGLE.source, 'gi');
+
 // -----------------------------------------------------------------------------
 // Turn Boundary Types
 // -----------------------------------------------------------------------------
@@ -99,7 +109,8 @@ export function extractTurnRanges(rawLog: string): TurnRange[] {
   // We use the global flag (g) to find all matches, not just the first.
   // The exec() method in a loop gives us match positions.
 
-  const pattern = new RegExp(EXTRACT_TURN_NUMBER.source, 'gim');
+  const pattern = TURN_NUMBER_GLOBAL;
+  pattern.lastIndex = 0;
 
   let match: RegExpExecArray | null;
   while ((match = pattern.exec(normalized)) !== null) {
@@ -135,6 +146,32 @@ export function extractTurnRanges(rawLog: string): TurnRange[] {
   return ranges;
 }
 
+/**
+ * Parses a single log line as a turn marker.
+ *
+ * Line-at-a-time counterpart of extractTurnRanges() for callers that are
+ * already walking the log line by line and tracking their own offset.
+ *
+ * @param line - One line of the newline-normalized log
+ * @param startOffset - Character offset of the line in the normalized log
+ * @returns The turn range starting at this line, or null if it isn't a turn marker
+ */
+export function parseTurnLine(line: string, startOffset: number): TurnRange | null {
+  const match = TURN_NUMBER_LINE.exec(line);
+  if (!match) {
+    return null;
+  }
+
+  const playerMatch = EXTRACT_ACTIVE_PLAYER.exec(line);
+  const player = (playerMatch?.[1] ?? playerMatch?.[2])?.trim();
+
+  return {
+    turnNumber: parseInt(match[1], 10),
+    startOffset,
+    player,
+  };
+}
+
 /**
  * Gets the maximum turn number from a list of turn ranges.
  *
@@ -142,10 +179,13 @@ export function extractTurnRanges(rawLog: string): TurnRange[] {
  * @returns The highest turn number, or 0 if no turns found
  */
 export function getMaxTurn(ranges: TurnRange[]): number {
-  if (ranges.length === 0) {
-    return 0;
+  let maxTurn = 0;
+  for (const range of ranges) {
+    if (range.turnNumber > maxTurn) {
+      maxTurn = range.turnNumber;
+    }
   }
-  return Math.max(...ranges.map((r) => r.turnNumber));
+  return maxTurn;
 }
 
 // -----------------------------------------------------------------------------
@@ -278,6 +318,18 @@ export function sliceByTurn(
 // Mana Metrics
 // -----------------------------------------------------------------------------
 
+/**
+ * Counts matches of a global regex without building the array that
+ * String.match would return. These counters run on every log line, so
+ * skipping the per-call allocation adds up.
+ */
+function countMatches(pattern: RegExp, text: string): number {
+  pattern.lastIndex = 0;
+  let count = 0;
+  while (pattern.exec(text) !== null) count++;
+  return count;
+}
+
 /**
  * Counts mana production events in a text chunk.
  *
@@ -294,12 +346,10 @@ export function sliceByTurn(
  */
 export function countManaEvents(chunk: string): number {
   // Count matches of the main mana pattern
-  const manaMatches = chunk.match(new RegExp(EXTRACT_MANA_PRODUCED.source, 'gi'));
-  const manaCount = manaMatches?.length ?? 0;
+  const manaCount = countMatches(MANA_PRODUCED_GLOBAL, chunk);
 
   // Also count "tap X for Y" patterns (additional mana detection)
-  const tapMatches = chunk.match(new RegExp(EXTRACT_TAP_FOR.source, 'gi'));
-  const tapCount = tapMatches?.length ?? 0;
+  const tapCount = countMatches(TAP_FOR_GLOBAL, chunk);
 
   // Combine counts (may have some overlap, but better to over-count than miss)
   return manaCount + tapCount;
@@ -313,6 +363,8 @@ export function countManaEvents(chunk: string): number {
  *
  * @param rawLog - The complete raw log text
  * @param numPlayers - Optional number of players (auto-detected if not provided)
+ * @param turnRanges - Optional pre-computed ranges from extractTurnRanges(rawLog),
+ *                     so callers that already have them skip a second scan
  * @returns Object mapping round number -> mana info
  *
  * @example
@@ -321,10 +373,11 @@ export function countManaEvents(chunk: string): number {
  */
 export function calculateManaPerTurn(
   rawLog: string,
-  numPlayers?: number
+  numPlayers?: number,
+  turnRanges?: TurnRange[]
 ): Record<number, TurnManaInfo> {
   const normalized = rawLog.replace(/\r\n/g, '\n').replace(/\r/g, '\n');
-  const ranges = extractTurnRanges(normalized);
+  const ranges = turnRanges ?? extractTurnRanges(normalized);
   const chunks = sliceByTurn(normalized, ranges);
   const playerCount = numPlayers ?? getNumPlayers(ranges);
   const result: Record<number, TurnManaInfo> = {};
@@ -374,7 +427,8 @@ export function countCardsDrawn(chunk: string): number {
   // -------------------------------------------------------------------------
   // Count "draws N cards" patterns (multiple cards)
   // -------------------------------------------------------------------------
-  const multiplePattern = new RegExp(EXTRACT_DRAW_MULTIPLE.source, 'gi');
+  const multiplePattern = DRAW_MULTIPLE_GLOBAL;
+  multiplePattern.lastIndex = 0;
   let multiMatch: RegExpExecArray | null;
   while ((multiMatch = multiplePattern.exec(chunk)) !== null) {
     const count = parseInt(multiMatch[1], 10);
@@ -388,8 +442,7 @@ export function countCardsDrawn(chunk: string): number {
   // -------------------------------------------------------------------------
   // We use a negative lookahead (?!s) in the pattern to avoid matching
   // "draws 3 cards" again (already counted above).
-  const singleMatches = chunk.match(new RegExp(EXTRACT_DRAW_SINGLE.source, 'gi'));
-  total += singleMatches?.length ?? 0;
+  total += countMatches(DRAW_SINGLE_GLOBAL, chunk);
 
   return total;
 }
@@ -402,14 +455,16 @@ export function countCardsDrawn(chunk: string): number {
  *
  * @param rawLog - The complete raw log text
  * @param numPlayers - Optional number of players (auto-detected if not provided)
+ * @param turnRanges - Optional pre-computed ranges from extractTurnRanges(rawLog)
  * @returns Object mapping round number -> cards drawn
  */
 export function calculateCardsDrawnPerTurn(
   rawLog: string,
-  numPlayers?: number
+  numPlayers?: number,
+  turnRanges?: TurnRange[]
 ): Record<number, number> {
   const normalized = rawLog.replace(/\r\n/g, '\n').replace(/\r/g, '\n');
-  const ranges = extractTurnRanges(normalized);
+  const ranges = turnRanges ?? extractTurnRanges(normalized);
   const chunks = sliceByTurn(normalized, ranges);
   const playerCount = numPlayers ?? getNumPlayers(ranges);
   const result: Record<number, number> = {};
@@ -443,10 +498,37 @@ export function calculateCardsDrawnPerTurn(
  * @returns The winner's identifier, or undefined if not found
  */
 export function extractWinner(rawLog: string): string | undefined {
-  const match = EXTRACT_WINNER.exec(rawLog);
+  // EXTRACT_WINNER opens with a lazy (.+?), so a search from the top of the
+  // log re-scans every line character by character before reaching the
+  // outcome at the bottom. Every match contains a win phrase, so find the
+  // first one with a cheap literal search and start from the line it hangs
+  // off instead.
+  const phrase = WIN_PHRASE.exec(rawLog);
+  if (!phrase) return undefined;
+
+  const match = EXTRACT_WINNER.exec(rawLog.slice(winnerSearchStart(rawLog, phrase.index)));
   return match?.[1]?.trim().replace(/^Game outcome:\s*/i, '');
 }
 
+/** The win phrases of EXTRACT_WINNER, without its leading name capture. */
+const WIN_PHRASE = /wins\s+the\s+game|has\s+won/i;
+
+/**
+ * Earliest offset a match of EXTRACT_WINNER can start at, given the first
+ * win phrase is at `phraseIndex`. The name capture (.+?) can't cross a line
+ * terminator, but the \s+ after it can, so the match may begin on the last
+ * line with non-whitespace text at or before the phrase — never earlier.
+ */
+function winnerSearchStart(rawLog: string, phraseIndex: number): number {
+  let i = phraseIndex - 1;
+  while (i >= 0 && /\s/.test(rawLog[i])) i--;
+  while (i >= 0 && !LINE_TERMINATOR.test(rawLog[i])) i--;
+  return i + 1;
+}
+
+/** Characters `.` refuses to match, i.e. where the name capture must stop. */
+const LINE_TERMINATOR = /[\n\r\u2028\u2029]/;
+
 /**
  * Determines the winning turn as the winner's personal turn count.
  *
@@ -509,8 +591,12 @@ export function extractWinningTurn(rawLog: string): number | undefined {
  *
  * The player name group uses a greedy match up to the last space-digit sequence,
  * which avoids ambiguity with digit-suffix deck names (e.g., "Ai(4)-Deck 2000").
+ *
+ * Global so one exec() loop pulls every entry out of a turn chunk without
+ * splitting it into lines. The lookarounds pin each match to a whole line,
+ * and [^\S\n] keeps whitespace from running across a line break.
  */
-const LIFE_LOG_PATTERN = /^\[LIFE\] Life: (.+)\s+(-?\d+)\s*->\s*(-?\d+)$/;
+const LIFE_LOG_PATTERN = /(?<![^\n])\[LIFE\] Life: (.+)[^\S\n]+(-?\d+)[^\S\n]*->[^\S\n]*(-?\d+)(?![^\n])/g;
 
 /**
  * Calculates life totals per round for all players.
@@ -529,16 +615,24 @@ const LIFE_LOG_PATTERN = /^\[LIFE\] Life: (.+)\s+(-?\d+)\s*->\s*(-?\d+)$/;
  * @param rawLog - The complete raw log text
  * @param players - Array of player identifiers (e.g., ["Ai(1)-Doran Big Butts", ...])
  * @param numPlayers - Number of players in the game (optional, auto-detected if not provided)
+ * @param turnRanges - Optional pre-computed ranges from extractTurnRanges(rawLog),
+ *                     so callers that already have them skip a second scan
  * @returns Map of round number -> map of player name -> life total at end of round.
  *          Empty `{}` when no `[LIFE]` entries are present.
  */
 export function calculateLifePerTurn(
   rawLog: string,
   players: string[],
-  numPlayers?: number
+  numPlayers?: number,
+  turnRanges?: TurnRange[]
 ): Record<number, Record<string, number>> {
+  // Logs from Forge versions without life tracking have nothing to parse
+  if (!rawLog.includes('[LIFE]')) {
+    return {};
+  }
+
   const normalized = rawLog.replace(/\r\n/g, '\n').replace(/\r/g, '\n');
-  const ranges = extractTurnRanges(normalized);
+  const ranges = turnRanges ?? extractTurnRanges(normalized);
   const chunks = sliceByTurn(normalized, ranges);
   const playerCount = numPlayers ?? getNumPlayers(ranges);
 
@@ -568,10 +662,9 @@ export function calculateLifePerTurn(
     const roundChunks = roundGroups.get(round)!;
 
     for (const { chunk } of roundChunks) {
-      for (const line of chunk.split('\n')) {
-        const match = LIFE_LOG_PATTERN.exec(line);
-        if (!match) continue;
-
+      LIFE_LOG_PATTERN.lastIndex = 0;
+      let match: RegExpExecArray | null;
+      while ((match = LIFE_LOG_PATTERN.exec(chunk)) !== null) {
         hasLifeEntries = true;
         const logName = match[1];
         const newLife = parseInt(match[3], 10);
@@ -16,13 +16,29 @@ export interface DeckMetadataEntry {
   colorIdentity: string[];
 }
 
+/**
+ * Last parsed metadata file, keyed by path + mtime. The color-identity route
+ * looks up every deck in the list, so without this each request re-read and
+ * re-parsed the whole file once per deck; now a lookup costs one stat().
+ */
+let loaded: { path: string; mtimeMs: number; data: Record<string, DeckMetadataEntry> } | null = null;
+
 function loadMetadata(): Record<string, DeckMetadataEntry> {
   const metadataPath = getMetadataPath();
+  let mtimeMs: number;
   try {
-    if (fs.existsSync(metadataPath)) {
-      const raw = fs.readFileSync(metadataPath, 'utf-8');
-      return JSON.parse(raw) as Record<string, DeckMetadataEntry>;
-    }
+    mtimeMs = fs.statSync(metadataPath).mtimeMs;
+  } catch {
+    return {};
+  }
+  if (loaded && loaded.path === metadataPath && loaded.mtimeMs === mtimeMs) {
+    return loaded.data;
+  }
+  try {
+    const raw = fs.readFileSync(metadataPath, 'utf-8');
+    const data = JSON.parse(raw) as Record<string, DeckMetadataEntry>;
+    loaded = { path: metadataPath, mtimeMs, data };
+    return data;
   } catch (err) {
     console.error('Failed to load deck metadata:', err);
   }
@@ -36,8 +52,14 @@ function saveMetadata(metadata: Record<string, DeckMetadataEntry>): void {
       fs.mkdirSync(cacheDir, { recursive: true });
     }
     const metadataPath = getMetadataPath();
-    fs.writeFileSync(metadataPath, JSON.stringify(metadata, null, 2), 'utf-8');
+    // Compact like the Scryfall cache: this file is only ever read back by
+    // loadMetadata, and indentation is pure serialize/write overhead.
+    fs.writeFileSync(metadataPath, JSON.stringify(metadata), 'utf-8');
+    loaded = { path: metadataPath, mtimeMs: fs.statSync(metadataPath).mtimeMs, data: metadata };
   } catch (err) {
+    // Callers mutate the loaded object before saving; drop it so the next
+    // load reflects what is actually on disk.
+    loaded = null;
     console.error('Failed to save deck metadata:', err);
   }
 }
@@ -93,7 +93,7 @@ export async function listAllDecks(): Promise<DeckListItem[]> {
   }
 
   const preconItems = listPreconsFromSqlite();
-  const saved = listSavedDecks();
+  const saved = await listSavedDecks();
 
   const savedItems: DeckListItem[] = saved.map((s) => ({
     id: s.filename,
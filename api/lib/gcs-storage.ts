@@ -1,14 +1,32 @@
-import { Storage } from '@google-cloud/storage';
+import { createHash } from 'crypto';
+import type { Bucket, Storage } from '@google-cloud/storage';
 import { isRetryableGcsError } from './gcs-retry';
 import { withRetry } from './retry';
 
-// Initialize Cloud Storage client
-const storage = new Storage({
-  projectId: process.env.GOOGLE_CLOUD_PROJECT || 'magic-bracket-simulator',
-});
-
 const BUCKET_NAME = process.env.GCS_BUCKET || 'magic-bracket-simulator-artifacts';
-const bucket = storage.bucket(BUCKET_NAME);
+
+let storage: Storage | null = null;
+let bucket: Bucket | null = null;
+
+/**
+ * Cloud Storage client, created on first use. log-store imports this module
+ * in every mode, so loading the SDK lazily keeps LOCAL mode and unit tests
+ * from paying for it.
+ */
+function getStorage(): Storage {
+  if (!storage) {
+    const { Storage } = require('@google-cloud/storage') as typeof import('@google-cloud/storage');
+    storage = new Storage({
+      projectId: process.env.GOOGLE_CLOUD_PROJECT || 'magic-bracket-simulator',
+    });
+  }
+  return storage;
+}
+
+function getBucket(): Bucket {
+  if (!bucket) bucket = getStorage().bucket(BUCKET_NAME);
+  return bucket;
+}
 
 /**
  * Upload a job artifact to GCS
@@ -32,7 +50,7 @@ export async function uploadJobArtifact(
 
   await withRetry(
     async () => {
-      const file = bucket.file(objectPath);
+      const file = getBucket().file(objectPath);
       await file.save(data, {
         contentType,
         metadata: { jobId },
@@ -57,7 +75,7 @@ export async function getJobArtifact(
   filename: string
 ): Promise<string | null> {
   const objectPath = `jobs/${jobId}/${filename}`;
-  const file = bucket.file(objectPath);
+  const file = getBucket().file(objectPath);
 
   try {
     const [exists] = await file.exists();
@@ -99,7 +117,7 @@ export async function getJobArtifactJson<T>(
  */
 export async function listJobArtifacts(jobId: string): Promise<string[]> {
   const prefix = `jobs/${jobId}/`;
-  const [files] = await bucket.getFiles({ prefix });
+  const [files] = await getBucket().getFiles({ prefix });
   
   return files.map(file => file.name.replace(prefix, ''));
 }
@@ -112,7 +130,7 @@ export async function deleteJobArtifacts(jobId: string): Promise<void> {
   const prefix = `jobs/${jobId}/`;
   
   try {
-    await bucket.deleteFiles({ prefix, force: true });
+    await getBucket().deleteFiles({ prefix, force: true });
   } catch (error) {
     console.error(`Error deleting artifacts for job ${jobId}:`, error);
     throw error;
@@ -168,7 +186,7 @@ export async function getSignedUrl(
   expiresInMinutes: number = 15
 ): Promise<string> {
   const objectPath = `jobs/${jobId}/${filename}`;
-  const file = bucket.file(objectPath);
+  const file = getBucket().file(objectPath);
 
   const [url] = await file.getSignedUrl({
     action: 'read',
@@ -180,24 +198,49 @@ export async function getSignedUrl(
 
 // Separate public bucket for static assets (the artifacts bucket has public access prevention).
 const PUBLIC_BUCKET_NAME = 'magic-bracket-simulator-public';
-const publicBucket = storage.bucket(PUBLIC_BUCKET_NAME);
+let publicBucket: Bucket | null = null;
+
+function getPublicBucket(): Bucket {
+  if (!publicBucket) publicBucket = getStorage().bucket(PUBLIC_BUCKET_NAME);
+  return publicBucket;
+}
+
+const PRECONS_CACHE_CONTROL = 'public, max-age=3600';
 
 /**
  * Upload the precons list as a public JSON file for direct frontend consumption.
  * Uses a dedicated public bucket (IAM grants allUsers objectViewer).
  * Sets Cache-Control for browser caching.
+ *
+ * Skips the upload when the stored object already has identical content
+ * (GCS keeps an MD5 of every object) and the expected Cache-Control, so a
+ * sync that changed nothing costs one metadata read instead of a rewrite.
  */
-export async function uploadPreconsJson(precons: unknown[]): Promise<string> {
+export async function uploadPreconsJson(
+  precons: unknown[]
+): Promise<{ url: string; uploaded: boolean }> {
   const objectPath = 'precons.json';
-  const file = publicBucket.file(objectPath);
+  const file = getPublicBucket().file(objectPath);
+  const url = `https://storage.googleapis.com/${PUBLIC_BUCKET_NAME}/${objectPath}`;
+  const body = JSON.stringify(precons);
+
+  const md5Hash = createHash('md5').update(body).digest('base64');
+  try {
+    const [metadata] = await file.getMetadata();
+    if (metadata.md5Hash === md5Hash && metadata.cacheControl === PRECONS_CACHE_CONTROL) {
+      return { url, uploaded: false };
+    }
+  } catch {
+    // Not uploaded yet, or the lookup failed — fall through to a full upload
+  }
 
   await withRetry(
     async () => {
-      await file.save(JSON.stringify(precons), {
+      await file.save(body, {
         contentType: 'application/json',
       });
       await file.setMetadata({
-        cacheControl: 'public, max-age=3600',
+        cacheControl: PRECONS_CACHE_CONTROL,
       });
     },
     { maxAttempts: 3, delayMs: 1000, backoffMultiplier: 2 },
@@ -205,7 +248,7 @@ export async function uploadPreconsJson(precons: unknown[]): Promise<string> {
     isRetryableGcsError
   );
 
-  return `https://storage.googleapis.com/${PUBLIC_BUCKET_NAME}/${objectPath}`;
+  return { url, uploaded: true };
 }
 
-export { storage, bucket, BUCKET_NAME };
+export { getStorage, getBucket, BUCKET_NAME };
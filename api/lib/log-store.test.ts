@@ -260,6 +260,16 @@ async function runTests() {
       assertEqual(result!.length, 4, 'should have 4 condensed games');
     });
 
+    await test('getCondensedLogs: repeated fallback reuses condensed games for identical logs', async () => {
+      const first = await logStore.getCondensedLogs('job-condensed-fallback');
+      const second = await logStore.getCondensedLogs('job-condensed-fallback');
+      assert(first !== null && second !== null, 'should not be null');
+      assertEqual(second!.length, first!.length, 'same game count');
+      for (let i = 0; i < first!.length; i++) {
+        assert(second![i] === first![i], `game ${i} should come from the content-hash cache`);
+      }
+    });
+
     // =========================================================================
     // getStructuredLogs
     // =========================================================================
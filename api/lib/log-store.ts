@@ -7,9 +7,11 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
+import { createHash } from 'crypto';
 import { isGcpMode } from './env';
 import * as gcs from './gcs-storage';
-import { condenseGames, structureGames, splitConcatenatedGames } from './condenser/index';
+import { condenseGame, structureGames, splitConcatenatedGames } from './condenser/index';
+import { lruTouch, lruEvictIfFull } from './lru';
 import type { CondensedGame, StructuredGame } from './types';
 
 // Local filesystem storage directory
@@ -36,6 +38,27 @@ function getMetaPath(jobId: string): string {
   return path.join(getJobDir(jobId), 'meta.json');
 }
 
+// In-memory cache of condensed games keyed by a hash of the raw log text.
+// The same logs get condensed repeatedly: re-ingests after aggregation
+// retries or recompute-job-logs, and the raw-log fallback in
+// getCondensedLogs, which runs on every GET for jobs without precomputed
+// data. Condensing is a pure function of the log, so a hit is always valid.
+// Entries are shared between callers and must be treated as read-only.
+const CONDENSED_CACHE_MAX_SIZE = 64;
+const condensedByLogHash = new Map<string, CondensedGame>();
+
+function condenseGamesCached(rawLogs: string[]): CondensedGame[] {
+  return rawLogs.map((log) => {
+    const key = createHash('sha256').update(log).digest('base64');
+    const cached = lruTouch(condensedByLogHash, key);
+    if (cached) return cached;
+    const condensed = condenseGame(log);
+    lruEvictIfFull(condensedByLogHash, CONDENSED_CACHE_MAX_SIZE);
+    condensedByLogHash.set(key, condensed);
+    return condensed;
+  });
+}
+
 interface StoredMeta {
   deckNames?: string[];
   deckLists?: string[];
@@ -56,15 +79,17 @@ export async function ingestLogs(
   deckLists?: string[]
 ): Promise<{ gameCount: number }> {
   const expandedLogs = gameLogs.flatMap(splitConcatenatedGames);
-  const condensed = condenseGames(expandedLogs);
+  const condensed = condenseGamesCached(expandedLogs);
   const structured = structureGames(expandedLogs, deckNames);
 
   if (isGcpMode()) {
-    // Upload raw logs
-    await gcs.uploadRawLogs(jobId, expandedLogs);
-    // Upload pre-computed JSON
-    await gcs.uploadJobArtifact(jobId, 'condensed.json', JSON.stringify(condensed));
-    await gcs.uploadJobArtifact(jobId, 'structured.json', JSON.stringify({ games: structured, deckNames }));
+    // Upload raw logs and pre-computed JSON concurrently — the objects are
+    // independent, so total latency is the slowest upload rather than the sum.
+    await Promise.all([
+      gcs.uploadRawLogs(jobId, expandedLogs),
+      gcs.uploadJobArtifact(jobId, 'condensed.json', JSON.stringify(condensed)),
+      gcs.uploadJobArtifact(jobId, 'structured.json', JSON.stringify({ games: structured, deckNames })),
+    ]);
   } else {
     // Local filesystem
     const jobDir = getJobDir(jobId);
@@ -91,7 +116,9 @@ export async function ingestLogs(
       condensed,
       structured,
     };
-    fs.writeFileSync(getMetaPath(jobId), JSON.stringify(meta, null, 2), 'utf-8');
+    // Compact JSON: meta carries every condensed event and structured game,
+    // and indentation adds ~50% to its size on disk plus encode/parse time.
+    fs.writeFileSync(getMetaPath(jobId), JSON.stringify(meta), 'utf-8');
   }
 
   return { gameCount: expandedLogs.length };
@@ -165,14 +192,14 @@ export async function getCondensedLogs(jobId: string): Promise<CondensedGame[] |
     // Fallback: compute from raw logs (e.g. FAILED jobs where bulk upload never happened)
     const raw = await gcs.getRawLogs(jobId);
     if (raw.length === 0) return null;
-    return condenseGames(raw);
+    return condenseGamesCached(raw);
   }
   const meta = readLocalMeta(jobId);
   if (meta?.condensed) return meta.condensed;
   // Fallback: compute from raw logs
   const raw = readLocalRawLogs(jobId);
   if (!raw) return null;
-  return condenseGames(raw);
+  return condenseGamesCached(raw);
 }
 
 export async function getStructuredLogs(
@@ -1,12 +1,40 @@
 import * as fs from 'fs';
 import * as path from 'path';
 
+// Hoisted so each call reuses the same RegExp objects instead of building
+// them from literals on every line or name.
+const COMMANDER_CARD_LINE = /^\d+\s*(?:x\s*)?(.+)$/;
+const DCK_EXTENSION = /\.dck$/;
+// Whole-content patterns. Lines are \n-delimited (the lookarounds) and
+// [^\S\n] stands in for the whitespace trim() would strip from each line.
+const DECK_NAME_LINE = /(?<![^\n])[^\S\n]*name=([^\n]*)/i;
+const COMMANDER_HEADER_LINE = /(?<![^\n])[^\S\n]*\[commander\][^\S\n]*(?![^\n])/i;
+
+const SLUG_MAX_LENGTH = 100;
+// Deck files read at once by listSavedDecks. Bounded so a large decks
+// directory can't exhaust file descriptors (EMFILE).
+const DECK_READ_CONCURRENCY = 8;
+
 export interface SavedDeck {
   id: string;
   name: string;
   filename: string;
 }
 
+/**
+ * Yields the lines of .dck content one at a time (without the trailing \n),
+ * beginning at the line that starts at `start`. Callers that stop early
+ * never pay to split the rest of the file.
+ */
+function* iterateLines(content: string, start = 0): Generator<string> {
+  while (start <= content.length) {
+    let end = content.indexOf('\n', start);
+    if (end === -1) end = content.length;
+    yield content.slice(start, end);
+    start = end + 1;
+  }
+}
+
 function getDecksDir(): string {
   const forgeEnginePath = process.env.FORGE_ENGINE_PATH || '../worker/forge-engine';
   return path.resolve(forgeEnginePath, 'decks');
@@ -18,9 +46,13 @@ function getDecksDir(): string {
  * Returns the card name (part before first |) or undefined if no Commander section.
  */
 export function parseCommanderFromContent(content: string): string | undefined {
-  const lines = content.split(/\r?\n/);
+  // Jump straight to the first [Commander] header instead of walking the
+  // metadata lines before it.
+  const header = COMMANDER_HEADER_LINE.exec(content);
+  if (!header) return undefined;
+
   let inCommander = false;
-  for (const line of lines) {
+  for (const line of iterateLines(content, header.index)) {
     const trimmed = line.trim();
     if (trimmed.toLowerCase() === '[commander]') {
       inCommander = true;
@@ -30,7 +62,7 @@ export function parseCommanderFromContent(content: string): string | undefined {
       if (trimmed.startsWith('[')) {
         break;
       }
-      const match = trimmed.match(/^\d+\s*(?:x\s*)?(.+)$/);
+      const match = trimmed.match(COMMANDER_CARD_LINE);
       if (match) {
         const rest = match[1].trim();
         const pipeIndex = rest.indexOf('|');
@@ -46,14 +78,8 @@ export function parseCommanderFromContent(content: string): string | undefined {
  * Looks for Name=... in the [metadata] section.
  */
 function parseDeckName(content: string, fallbackName: string): string {
-  const lines = content.split('\n');
-  for (const line of lines) {
-    const trimmed = line.trim();
-    if (trimmed.toLowerCase().startsWith('name=')) {
-      return trimmed.substring(5).trim();
-    }
-  }
-  return fallbackName;
+  const match = DECK_NAME_LINE.exec(content);
+  return match ? match[1].trim() : fallbackName;
 }
 
 /**
@@ -61,11 +87,25 @@ function parseDeckName(content: string, fallbackName: string): string {
  * e.g. "Doran Big Butts" -> "doran-big-butts"
  */
 export function slugify(name: string): string {
-  return name
-    .toLowerCase()
-    .replace(/[^a-z0-9]+/g, '-')
-    .replace(/^-+|-+$/g, '')
-    .substring(0, 100); // Limit length
+  // Single pass over the lowercased name: keep [a-z0-9], collapse every other
+  // run into one '-', and never emit a leading or trailing '-'. Equivalent to
+  // replace(/[^a-z0-9]+/g, '-') then trimming edge dashes, without the two
+  // intermediate strings.
+  const lower = name.toLowerCase();
+  let slug = '';
+  let pendingDash = false;
+  for (let i = 0; i < lower.length && slug.length < SLUG_MAX_LENGTH; i++) {
+    const code = lower.charCodeAt(i);
+    const isAlnum = (code >= 0x61 && code <= 0x7a) || (code >= 0x30 && code <= 0x39);
+    if (!isAlnum) {
+      pendingDash = true;
+      continue;
+    }
+    if (pendingDash && slug) slug += '-';
+    pendingDash = false;
+    slug += lower[i];
+  }
+  return slug.substring(0, SLUG_MAX_LENGTH); // Limit length
 }
 
 /**
@@ -87,10 +127,17 @@ function isValidDeckFilename(filename: string): boolean {
   return true;
 }
 
+/**
+ * Parsed deck names from the last listing, keyed by file path and validated by
+ * mtime + size. Deck files are rarely edited in place, so repeat listings
+ * cost one stat() per deck instead of a full read and parse.
+ */
+let deckNameCache = new Map<string, { mtimeMs: number; size: number; name: string }>();
+
 /**
  * List all saved decks from the decks directory.
  */
-export function listSavedDecks(): SavedDeck[] {
+export async function listSavedDecks(): Promise<SavedDeck[]> {
   const decksDir = getDecksDir();
   
   try {
@@ -98,30 +145,58 @@ export function listSavedDecks(): SavedDeck[] {
       return [];
     }
     
-    const files = fs.readdirSync(decksDir);
-    const decks: SavedDeck[] = [];
+    // withFileTypes reports the entry type from the directory read itself, so
+    // directories are skipped without a stat per entry. Symlinks are kept and
+    // resolved by the read below.
+    const entries = await fs.promises.readdir(decksDir, { withFileTypes: true });
+    const files = entries
+      .filter((entry) => (entry.isFile() || entry.isSymbolicLink()) && entry.name.endsWith('.dck'))
+      .map((entry) => entry.name);
     
-    for (const file of files) {
-      if (!file.endsWith('.dck')) {
-        continue;
-      }
-      
+    // Read the deck files concurrently rather than one after another, with
+    // at most DECK_READ_CONCURRENCY in flight. Only files still present are
+    // carried into the next cache, so deleted decks drop out of it.
+    const nextCache: typeof deckNameCache = new Map();
+    const readDeck = async (file: string): Promise<SavedDeck | null> => {
       const filePath = path.join(decksDir, file);
       try {
-        const content = fs.readFileSync(filePath, 'utf-8');
-        const fallbackName = file.replace(/\.dck$/, '');
-        const name = parseDeckName(content, fallbackName);
+        const { mtimeMs, size } = await fs.promises.stat(filePath);
+        const cached = deckNameCache.get(filePath);
+        let name: string;
+        if (cached && cached.mtimeMs === mtimeMs && cached.size === size) {
+          name = cached.name;
+        } else {
+          const content = await fs.promises.readFile(filePath, 'utf-8');
+          const fallbackName = file.replace(DCK_EXTENSION, '');
+          name = parseDeckName(content, fallbackName);
+        }
+        nextCache.set(filePath, { mtimeMs, size, name });
         
-        decks.push({
+        return {
           id: file, // Use filename as ID
           name,
           filename: file,
-        });
+        };
       } catch (err) {
         console.error(`Failed to read deck file ${file}:`, err);
         // Skip this file
+        return null;
       }
-    }
+    };
+
+    const results: (SavedDeck | null)[] = new Array(files.length).fill(null);
+    let nextIndex = 0;
+    const worker = async () => {
+      while (nextIndex < files.length) {
+        const i = nextIndex++;
+        results[i] = await readDeck(files[i]);
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(DECK_READ_CONCURRENCY, files.length) }, worker)
+    );
+    deckNameCache = nextCache;
+    const decks = results.filter((deck): deck is SavedDeck => deck !== null);
     
     // Sort by name
     decks.sort((a, b) => a.name.localeCompare(b.name));
@@ -136,8 +211,8 @@ export function listSavedDecks(): SavedDeck[] {
 /**
  * Get a saved deck by its ID (filename).
  */
-export function getSavedDeck(id: string): SavedDeck | undefined {
-  const decks = listSavedDecks();
+export async function getSavedDeck(id: string): Promise<SavedDeck | undefined> {
+  const decks = await listSavedDecks();
   return decks.find(d => d.id === id);
 }
 
@@ -164,7 +239,7 @@ export function readSavedDeckContent(filename: string): { name: string; dck: str
       return null;
     }
     const content = fs.readFileSync(filePath, 'utf-8');
-    const fallbackName = filename.replace(/\.dck$/, '');
+    const fallbackName = filename.replace(DCK_EXTENSION, '');
     const name = parseDeckName(content, fallbackName);
     return { name, dck: content };
   } catch {
@@ -21,13 +21,25 @@ function normalizeCardName(cardName: string): string {
   return pipeIndex >= 0 ? trimmed.substring(0, pipeIndex).trim() : trimmed;
 }
 
+/** Last parsed cache file, keyed by path + mtime so cache hits skip the read and parse. */
+let loaded: { path: string; mtimeMs: number; data: Record<string, string[] | null> } | null = null;
+
 function loadCache(): Record<string, string[] | null> {
   const cachePath = getCachePath();
+  let mtimeMs: number;
   try {
-    if (fs.existsSync(cachePath)) {
-      const raw = fs.readFileSync(cachePath, 'utf-8');
-      return JSON.parse(raw) as Record<string, string[] | null>;
-    }
+    mtimeMs = fs.statSync(cachePath).mtimeMs;
+  } catch {
+    return {};
+  }
+  if (loaded && loaded.path === cachePath && loaded.mtimeMs === mtimeMs) {
+    return loaded.data;
+  }
+  try {
+    const raw = fs.readFileSync(cachePath, 'utf-8');
+    const data = JSON.parse(raw) as Record<string, string[] | null>;
+    loaded = { path: cachePath, mtimeMs, data };
+    return data;
   } catch (err) {
     console.error('Failed to load Scryfall cache:', err);
   }
@@ -42,11 +54,30 @@ function saveCache(cache: Record<string, string[] | null>): void {
     }
     const cachePath = getCachePath();
     fs.writeFileSync(cachePath, JSON.stringify(cache, null, 0), 'utf-8');
+    loaded = { path: cachePath, mtimeMs: fs.statSync(cachePath).mtimeMs, data: cache };
   } catch (err) {
+    loaded = null;
     console.error('Failed to save Scryfall cache:', err);
   }
 }
 
+/**
+ * Record a lookup result. The cache is re-read after the network call so
+ * entries saved by other lookups in the meantime are not overwritten.
+ */
+function rememberColorIdentity(cacheKey: string, colorIdentity: string[] | null): void {
+  const cache = loadCache();
+  cache[cacheKey] = colorIdentity;
+  saveCache(cache);
+}
+
+/**
+ * Lookups currently waiting on Scryfall, keyed like the disk cache. Concurrent
+ * requests for the same card (e.g. several decks sharing a commander during a
+ * backfill) share one HTTP call instead of racing to fetch and save it.
+ */
+const inFlight = new Map<string, Promise<string[]>>();
+
 /**
  * Fetch color identity for a card from Scryfall API.
  * Returns array of WUBRG letters (e.g. ["W","U","B","R","G"]) or [] if not found.
@@ -65,6 +96,17 @@ export async function getColorIdentity(cardName: string): Promise<string[]> {
     return cached ?? [];
   }
 
+  const pending = inFlight.get(cacheKey);
+  if (pending) return pending;
+
+  const lookup = fetchColorIdentity(normalized, cacheKey).finally(() => {
+    inFlight.delete(cacheKey);
+  });
+  inFlight.set(cacheKey, lookup);
+  return lookup;
+}
+
+async function fetchColorIdentity(normalized: string, cacheKey: string): Promise<string[]> {
   const url = `https://api.scryfall.com/cards/named?fuzzy=${encodeURIComponent(normalized)}`;
   try {
     const res = await fetch(url, {
@@ -74,19 +116,16 @@ export async function getColorIdentity(cardName: string): Promise<string[]> {
       },
     });
     if (!res.ok) {
-      cache[cacheKey] = null;
-      saveCache(cache);
+      rememberColorIdentity(cacheKey, null);
       return [];
     }
     const data = (await res.json()) as { color_identity?: string[] };
     const colorIdentity = Array.isArray(data.color_identity) ? data.color_identity : [];
-    cache[cacheKey] = colorIdentity;
-    saveCache(cache);
+    rememberColorIdentity(cacheKey, colorIdentity);
     return colorIdentity;
   } catch (err) {
     console.error(`Scryfall lookup failed for "${normalized}":`, err);
-    cache[cacheKey] = null;
-    saveCache(cache);
+    rememberColorIdentity(cacheKey, null);
     return [];
   }
 }
@@ -42,20 +42,23 @@ export async function processJobForRatings(
     return;
   }
 
-  const deckInfos = await Promise.all(
-    deckIds.map(async (id) => {
-      const deck = await getDeckById(id);
-      return {
-        id,
-        name: deck?.name ?? null,
-        setName: deck?.setName ?? null,
-        isPrecon: deck?.isPrecon ?? false,
-        primaryCommander: deck?.primaryCommander ?? null,
-      };
-    }),
-  );
-
-  const initialStoredRatings = await Promise.all(deckIds.map((id) => store.getRating(id)));
+  // Deck metadata and stored ratings are independent reads; issue all of
+  // them in one round.
+  const [deckInfos, initialStoredRatings] = await Promise.all([
+    Promise.all(
+      deckIds.map(async (id) => {
+        const deck = await getDeckById(id);
+        return {
+          id,
+          name: deck?.name ?? null,
+          setName: deck?.setName ?? null,
+          isPrecon: deck?.isPrecon ?? false,
+          primaryCommander: deck?.primaryCommander ?? null,
+        };
+      }),
+    ),
+    Promise.all(deckIds.map((id) => store.getRating(id))),
+  ]);
 
   const currentRatings: DeckRating[] = deckIds.map((id, idx) => {
     const stored = initialStoredRatings[idx];
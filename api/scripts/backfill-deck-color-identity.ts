@@ -18,7 +18,7 @@ async function main() {
 
   // Precons now get color identity from Archidekt sync, skip them.
   // Only backfill saved decks.
-  const decks = listSavedDecks();
+  const decks = await listSavedDecks();
   for (const deck of decks) {
     if (getColorIdentityByKey(deck.filename) != null) {
       continue;
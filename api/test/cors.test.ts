@@ -1,7 +1,5 @@
 import { NextRequest } from 'next/server';
-
-// Set CORS_ALLOWED_ORIGINS BEFORE importing middleware (evaluated at module load time)
-process.env.CORS_ALLOWED_ORIGINS = 'https://app.example.com,https://staging.example.com';
+import { createCorsMiddleware, parseAllowedOrigins } from '../middleware';
 
 // Simple test runner (matches project convention)
 let passed = 0;
@@ -39,8 +37,12 @@ function makeRequest(url: string, options?: { method?: string; origin?: string }
 async function runTests() {
   console.log('Running CORS middleware tests...');
 
-  // Dynamic import so the env var set above is picked up at module load time
-  const { middleware } = await import('../middleware');
+  // One middleware per CORS_ALLOWED_ORIGINS configuration, so the explicit
+  // list and the wildcard share a single test process.
+  const middleware = createCorsMiddleware(
+    parseAllowedOrigins('https://app.example.com,https://staging.example.com')
+  );
+  const wildcardMiddleware = createCorsMiddleware(parseAllowedOrigins('*'));
 
   // Test 1: OPTIONS preflight returns 204 with full CORS headers
   await test('OPTIONS preflight returns 204 with full CORS headers', () => {
@@ -134,6 +136,17 @@ async function runTests() {
       `Expected no Allow-Origin header, got '${res.headers.get('Access-Control-Allow-Origin')}'`);
   });
 
+  // Test 8: Wildcard config returns literal "*" and drops credentials
+  await test('Wildcard allows any origin as literal "*" and disables credentials', () => {
+    const req = makeRequest('http://localhost:3000/api/jobs', {
+      method: 'GET',
+      origin: 'https://evil.com',
+    });
+    const res = wildcardMiddleware(req);
+    assert(res.headers.get('Access-Control-Allow-Origin') === '*', 'Expected *');
+    assert(res.headers.get('Access-Control-Allow-Credentials') === null, 'Expected credentials to be omitted or false');
+  });
+
   console.log(`\n${passed} passed, ${failed} failed`);
   if (failed > 0) {
     process.exit(1);
@@ -54,6 +54,53 @@ function assertEqual<T>(actual: T, expected: T, message: string) {
   }
 }
 
+/**
+ * Runs fn with globalThis.fetch replaced by a canned responder, so fetch-based
+ * ingestion can be tested without touching the network.
+ */
+async function withStubbedFetch<T>(
+  respond: (url: string) => Response,
+  fn: () => Promise<T>
+): Promise<T> {
+  const originalFetch = globalThis.fetch;
+  globalThis.fetch = (async (input: RequestInfo | URL) => respond(String(input))) as typeof fetch;
+  try {
+    return await fn();
+  } finally {
+    globalThis.fetch = originalFetch;
+  }
+}
+
+// Minimal ManaPool __data.json payload in SvelteKit's devalue layout: index 0
+// of the data array is the page shape, and every shape maps field names to
+// indices in the same array.
+const MANAPOOL_DATA_RESPONSE = {
+  type: 'data',
+  nodes: [
+    { type: 'skip' },
+    {
+      type: 'data',
+      data: [
+        { deck: 1, cards: 3 },
+        { name: 2 },
+        'BMK Doran',
+        [4, 9],
+        { quantity: 5, is_commander: 6, card: 7 },
+        1,
+        true,
+        { name: 8 },
+        'Doran, the Siege Tower',
+        { quantity: 10, is_commander: 11, card: 12 },
+        99,
+        false,
+        { name: 13, setCode: 14 },
+        'Forest',
+        'ONE',
+      ],
+    },
+  ],
+};
+
 async function runTests() {
   console.log('Running ingestion unit tests...\n');
 
@@ -169,27 +216,45 @@ async function runTests() {
   });
 
   // -------------------------------------------------------------------------
-  // ManaPool live API test (hits manapool.com)
+  // ManaPool fetch (stubbed fetch, no network)
   // -------------------------------------------------------------------------
 
-  await asyncTest('fetchDeckFromManaPoolUrl fetches real deck from ManaPool', async () => {
-    const deck = await fetchDeckFromManaPoolUrl(
-      'https://manapool.com/lists/5dc58054-55a8-4ca4-85c4-ae8e12d1b3d5?ref=cah'
+  await asyncTest('fetchDeckFromManaPoolUrl parses a SvelteKit devalue response', async () => {
+    let requestedUrl = '';
+    const deck = await withStubbedFetch(
+      (url) => {
+        requestedUrl = url;
+        return new Response(JSON.stringify(MANAPOOL_DATA_RESPONSE), { status: 200 });
+      },
+      () => fetchDeckFromManaPoolUrl(
+        'https://manapool.com/lists/5dc58054-55a8-4ca4-85c4-ae8e12d1b3d5?ref=cah'
+      )
     );
 
-    assertEqual(deck.name, 'BMK Doran', 'deck name');
-    assert(deck.commanders.length >= 1, `Expected at least 1 commander, got ${deck.commanders.length}`);
-    assert(
-      deck.commanders.some(c => c.name.includes('Doran')),
-      `Expected a commander named Doran, got: ${deck.commanders.map(c => c.name).join(', ')}`
+    assertEqual(
+      requestedUrl,
+      'https://manapool.com/lists/5dc58054-55a8-4ca4-85c4-ae8e12d1b3d5/__data.json',
+      'data URL'
     );
-    assert(deck.mainboard.length > 80, `Expected 80+ mainboard cards, got ${deck.mainboard.length}`);
+    assertEqual(deck.name, 'BMK Doran', 'deck name');
+    assertEqual(deck.commanders.length, 1, 'commander count');
+    assertEqual(deck.commanders[0].name, 'Doran, the Siege Tower', 'commander name');
+    assertEqual(deck.mainboard.length, 1, 'mainboard entries');
+    assertEqual(deck.mainboard[0].quantity, 99, 'mainboard quantity');
+    assertEqual(deck.mainboard[0].setCode, 'ONE', 'set code');
+  });
 
-    // Verify total quantity sums to ~100 (standard Commander deck)
-    const totalQty =
-      deck.commanders.reduce((s, c) => s + c.quantity, 0) +
-      deck.mainboard.reduce((s, c) => s + c.quantity, 0);
-    assert(totalQty >= 99 && totalQty <= 101, `Expected ~100 total cards, got ${totalQty}`);
+  await asyncTest('fetchDeckFromManaPoolUrl reports a missing list on 404', async () => {
+    let message = '';
+    await withStubbedFetch(
+      () => new Response('Not Found', { status: 404 }),
+      () => fetchDeckFromManaPoolUrl(
+        'https://manapool.com/lists/5dc58054-55a8-4ca4-85c4-ae8e12d1b3d5'
+      )
+    ).catch((err: Error) => {
+      message = err.message;
+    });
+    assert(message.includes('ManaPool list not found'), `Unexpected error: ${message}`);
   });
 
   // -------------------------------------------------------------------------
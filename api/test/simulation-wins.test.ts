@@ -66,15 +66,16 @@ function assertArrayEqual<T>(actual: T[], expected: T[], message: string) {
   }
 }
 
+const TEST_DECKS: DeckSlot[] = [
+  { name: 'Deck A', dck: 'a' },
+  { name: 'Deck B', dck: 'b' },
+  { name: 'Deck C', dck: 'c' },
+  { name: 'Deck D', dck: 'd' },
+];
+
 // Helper to create a test job and return its ID
 function createTestJob(): string {
-  const decks: DeckSlot[] = [
-    { name: 'Deck A', dck: 'a' },
-    { name: 'Deck B', dck: 'b' },
-    { name: 'Deck C', dck: 'c' },
-    { name: 'Deck D', dck: 'd' },
-  ];
-  const job = createJob(decks, 8);
+  const job = createJob(TEST_DECKS, 8);
   return job.id;
 }
 
@@ -1,4 +1,4 @@
-import { test, expect, type Page } from '@playwright/test';
+import { test, expect, type Page, type Route } from '@playwright/test';
 
 const HISTOGRAM = [0, 0, 0, 0, 2, 5, 10, 15, 8, 4, 3, 2, 1, 0, 0, 0];
 const MAX_BIN_INDEX = 7;
@@ -29,37 +29,36 @@ const mockLeaderboardLong = {
   decks: Array.from({ length: 30 }, (_, i) => makeDeck(i + 1)),
 };
 
+// Mocked API endpoints as precompiled patterns. The API origin depends on the
+// environment, so these match on the path suffix, like the old `**/api/...`
+// globs did, without Playwright converting a glob on every request.
+const LEADERBOARD_URL = /\/api\/leaderboard[^/]*$/;
+const COVERAGE_CONFIG_URL = /\/api\/coverage\/config$/;
+const COVERAGE_STATUS_URL = /\/api\/coverage\/status$/;
+const ME_URL = /\/api\/me$/;
+
+/**
+ * Route handler that answers with a fixed JSON payload. The body is
+ * serialized once when the handler is built, not on every intercepted request.
+ */
+function fulfillJson(payload: unknown) {
+  const body = JSON.stringify(payload);
+  return (route: Route) => route.fulfill({ status: 200, contentType: 'application/json', body });
+}
+
+// Registered on the browser context rather than the page. Page-level routes
+// take precedence, so a single test can still override one of these.
 async function stubLeaderboardApis(page: Page, payload = mockLeaderboard) {
-  await page.route('**/api/leaderboard*', (route) =>
-    route.fulfill({
-      status: 200,
-      contentType: 'application/json',
-      body: JSON.stringify(payload),
-    }),
-  );
-  await page.route('**/api/coverage/config', (route) =>
-    route.fulfill({
-      status: 200,
-      contentType: 'application/json',
-      body: JSON.stringify({ enabled: false, targetGamesPerPair: 100 }),
-    }),
-  );
-  await page.route('**/api/coverage/status', (route) =>
-    route.fulfill({
-      status: 200,
-      contentType: 'application/json',
-      body: JSON.stringify({ coveredPairs: 0, totalPairs: 0, percentComplete: 0 }),
-    }),
+  const context = page.context();
+  await context.route(LEADERBOARD_URL, fulfillJson(payload));
+  await context.route(COVERAGE_CONFIG_URL, fulfillJson({ enabled: false, targetGamesPerPair: 100 }));
+  await context.route(
+    COVERAGE_STATUS_URL,
+    fulfillJson({ coveredPairs: 0, totalPairs: 0, percentComplete: 0 }),
   );
   // Any other API calls from the page shell — keep them from 404-ing into
   // visible error states that could block the leaderboard from rendering.
-  await page.route('**/api/me', (route) =>
-    route.fulfill({
-      status: 200,
-      contentType: 'application/json',
-      body: JSON.stringify({ isAdmin: false }),
-    }),
-  );
+  await context.route(ME_URL, fulfillJson({ isAdmin: false }));
 }
 
 test.describe('WinTurnTooltip', () => {
@@ -133,14 +132,8 @@ test.describe('WinTurnTooltip', () => {
   });
 
   test('flips above the icon when there is not enough space below', async ({ page }) => {
-    await page.unroute('**/api/leaderboard*');
-    await page.route('**/api/leaderboard*', (route) =>
-      route.fulfill({
-        status: 200,
-        contentType: 'application/json',
-        body: JSON.stringify(mockLeaderboardLong),
-      }),
-    );
+    // Page-level route wins over the context-level stub from beforeEach
+    await page.route(LEADERBOARD_URL, fulfillJson(mockLeaderboardLong));
     await page.setViewportSize({ width: 1200, height: 700 });
     await page.goto('/leaderboard');
 
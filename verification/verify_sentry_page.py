@@ -1,4 +1,7 @@
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Error as PlaywrightError, sync_playwright
+
+# How long to wait for the page heading before giving up (ms)
+PAGE_LOAD_TIMEOUT_MS = 10_000
 
 def verify_sentry_page():
     with sync_playwright() as p:
@@ -10,8 +13,10 @@ def verify_sentry_page():
             print("Navigating to http://localhost:5173/sentry-example-page...")
             page.goto("http://localhost:5173/sentry-example-page")
 
-            # Wait for the main heading
-            page.wait_for_selector("text=Sentry Example Page")
+            # Wait for the main heading; returns as soon as it is visible
+            page.locator("text=Sentry Example Page").first.wait_for(
+                state="visible", timeout=PAGE_LOAD_TIMEOUT_MS
+            )
             print("Page loaded.")
 
             # Check buttons exist
@@ -23,10 +28,10 @@ def verify_sentry_page():
             page.screenshot(path=screenshot_path)
             print(f"Screenshot saved to {screenshot_path}")
 
-        except Exception as e:
+        except (PlaywrightError, AssertionError) as e:
             print(f"Error: {e}")
             page.screenshot(path="verification/error.png")
-            raise e
+            raise
         finally:
             browser.close()
 
@@ -39,21 +39,33 @@ const KeepCombat = /attacks?\s+with|declares?\s+attack|combat\s+damage|assigned\
 const KeepLandPlayed = /^Land:/i;
 
 // Extraction patterns
-const ExtractTurnMarkerNew = /^Turn:\s*Turn\s+(\d+)\s*\((.+)\)\s*$/i;
-const ExtractTurnMarkerOld = /^Turn\s+(\d+):\s*(.+?)\s*$/i;
+// Turn markers in either format, scanned across the whole log:
+//   new: "Turn: Turn N (PlayerName)"  -> groups 1-2
+//   old: "Turn N: PlayerName"         -> groups 3-4
+// Lines are \n-delimited (the lookarounds, as in GameResultLinePattern) and
+// [^\S\n] stands in for \s so a match never runs onto the next line.
+const TurnMarkerLinePattern =
+  /(?<![^\n])Turn(?::[^\S\n]*Turn[^\S\n]+(\d+)[^\S\n]*\((.+)\)|[^\S\n]+(\d+):[^\S\n]*(.+?))[^\S\n]*(?![^\n])/gi;
 const ExtractManaProduced = /(?:adds?|produces?|tap(s|ped)?\s+for)\s+[\w\s{}\d]*mana|(\d+)\s+mana\s+produced/i;
 const ExtractTapFor = /tap(s|ped)?\s+.*?\s+for/i;
 const ExtractDrawMultiple = /draws?\s+(\d+)\s+cards?/i;
 const ExtractDrawSingle = /draws?\s+(?:a\s+)?card(?!s)/i;
-const ExtractCMC = /\((?:CMC\s*)?(\d+)\)/i;
+// First "(N)" / "(CMC N)" on the line has N >= 5 — the parenthesized-CMC
+// fallback for lines KeepSpellHighCMC misses.
+const ParenCMCHigh = /^(?:(?!\((?:CMC\s*)?\d+\))[\s\S])*\((?:CMC\s*)?0*(?:[5-9]|[1-9]\d+)\)/i;
+// Both high-CMC checks folded into a single test.
+const KeepHighCMC = new RegExp(`${KeepSpellHighCMC.source}|${ParenCMCHigh.source}`, 'i');
 const ExtractWinnerRegex = /(.+?)\s+(?:wins\s+the\s+game|has\s+won!?)/i;
-const GameResultPattern = /^Game Result: Game (\d+) ended/i;
+// Game Result lines anywhere in a log. The lookbehind anchors to the start of
+// a \n-delimited line (unlike the `m` flag, which also treats a lone \r as a
+// line break), and the match runs to the end of that line.
+const GameResultLinePattern = /(?<![^\n])Game Result: Game \d+ ended[^\n]*/gi;
 
 // ============================================================================
 // Turn Range Extraction (from condenser.go)
 // ============================================================================
 
-interface TurnRange {
+export interface TurnRange {
   turnNumber: number;
   player: string;
   startIndex: number;
@@ -61,42 +73,42 @@ interface TurnRange {
 }
 
 function extractTurnRanges(rawLog: string): TurnRange[] {
-  const lines = rawLog.replace(/\r\n/g, '\n').split('\n');
+  const text = rawLog.replace(/\r\n/g, '\n');
   const ranges: TurnRange[] = [];
 
-  for (let i = 0; i < lines.length; i++) {
-    const line = lines[i];
-
-    // Try new format first: "Turn: Turn N (PlayerName)"
-    let matches = ExtractTurnMarkerNew.exec(line);
-    if (matches && matches.length > 2) {
-      ranges.push({
-        turnNumber: parseInt(matches[1], 10),
-        player: matches[2],
-        startIndex: i,
-        endIndex: -1,
-      });
-      continue;
+  // One regex scan finds every turn marker. Line indices are recovered by
+  // counting newlines between matches, so the log is never split into lines.
+  let line = 0;
+  let scanned = 0;
+  const lineAt = (index: number): number => {
+    let nl = text.indexOf('\n', scanned);
+    while (nl !== -1 && nl < index) {
+      line++;
+      nl = text.indexOf('\n', nl + 1);
     }
+    scanned = index;
+    return line;
+  };
 
-    // Try old format: "Turn N: PlayerName"
-    matches = ExtractTurnMarkerOld.exec(line);
-    if (matches && matches.length > 1) {
-      ranges.push({
-        turnNumber: parseInt(matches[1], 10),
-        player: matches[2] || '',
-        startIndex: i,
-        endIndex: -1,
-      });
-    }
+  TurnMarkerLinePattern.lastIndex = 0;
+  let match: RegExpExecArray | null;
+  while ((match = TurnMarkerLinePattern.exec(text)) !== null) {
+    const isNew = match[1] !== undefined;
+    ranges.push({
+      turnNumber: parseInt(isNew ? match[1] : match[3], 10),
+      player: (isNew ? match[2] : match[4]) || '',
+      startIndex: lineAt(match.index),
+      endIndex: -1,
+    });
   }
 
   // Set end indices
+  const lastLine = lineAt(text.length);
   for (let i = 0; i < ranges.length; i++) {
     if (i < ranges.length - 1) {
       ranges[i].endIndex = ranges[i + 1].startIndex - 1;
     } else {
-      ranges[i].endIndex = lines.length - 1;
+      ranges[i].endIndex = lastLine;
     }
   }
 
@@ -162,36 +174,31 @@ function filterLines(lines: string[]): string[] {
   return lines.filter((line) => !shouldIgnoreLine(line));
 }
 
-function splitAndFilter(rawLog: string): string[] {
-  const lines = rawLog.replace(/\r\n/g, '\n').split('\n');
-  return filterLines(lines);
-}
-
 /**
- * Split a log that contains multiple concatenated games
+ * Split a log that contains multiple concatenated games.
+ *
+ * Each game runs up to and including its Game Result line. Games are sliced
+ * straight out of the log instead of splitting it into lines and joining
+ * them back together.
  */
 export function splitConcatenatedGames(rawLog: string): string[] {
-  const lines = rawLog.replace(/\r\n/g, '\n').split('\n');
+  const text = rawLog.replace(/\r\n/g, '\n');
   const games: string[] = [];
-  let currentGame: string[] = [];
+  let start = 0;
 
-  for (const line of lines) {
-    if (GameResultPattern.test(line)) {
-      // End of a game - save current game and start new one
-      currentGame.push(line);
-      games.push(currentGame.join('\n'));
-      currentGame = [];
-    } else {
-      currentGame.push(line);
-    }
+  GameResultLinePattern.lastIndex = 0;
+  let match: RegExpExecArray | null;
+  while ((match = GameResultLinePattern.exec(text)) !== null) {
+    const end = match.index + match[0].length;
+    games.push(text.slice(start, end));
+    // Skip the newline that terminates the Game Result line
+    start = end + 1;
   }
 
   // Don't forget the last game if it doesn't end with Game Result
-  if (currentGame.length > 0) {
-    const remaining = currentGame.join('\n').trim();
-    if (remaining) {
-      games.push(remaining);
-    }
+  const remaining = text.slice(start).trim();
+  if (remaining) {
+    games.push(remaining);
   }
 
   // If no games were split, return the original as a single game
@@ -222,20 +229,12 @@ function classifyLine(line: string): EventType | null {
     return 'zone_change_gy_to_bf';
   }
 
-  // Priority 4: High CMC Spell Cast
-  if (KeepSpellHighCMC.test(line)) {
+  // Priority 4: High CMC Spell Cast (including CMC in parentheses that the
+  // main pattern might miss)
+  if (KeepHighCMC.test(line)) {
     return 'spell_cast_high_cmc';
   }
 
-  // Also check for CMC in parentheses that the main pattern might miss
-  const cmcMatches = ExtractCMC.exec(line);
-  if (cmcMatches && cmcMatches.length > 1) {
-    const cmc = parseInt(cmcMatches[1], 10);
-    if (cmc >= 5) {
-      return 'spell_cast_high_cmc';
-    }
-  }
-
   // Priority 5: Commander Cast
   if (KeepCommanderCast.test(line)) {
     return 'commander_cast';
@@ -310,56 +309,33 @@ function classifyLines(lines: string[]): GameEvent[] {
 // Metrics Calculation (from condenser.go)
 // ============================================================================
 
-function calculateManaPerTurn(
-  rawLog: string,
+/**
+ * Per-round mana events and cards drawn, accumulated in one walk over the
+ * turn segments. Both metrics share the same turn ranges and lines, so the
+ * log is split and scanned once instead of once per metric.
+ */
+function calculateTurnMetrics(
+  lines: string[],
+  turnRanges: TurnRange[],
   numPlayers: number
-): Record<number, TurnManaInfo> {
+): { manaPerTurn: Record<number, TurnManaInfo>; cardsDrawnPerTurn: Record<number, number> } {
   if (numPlayers === 0) {
     numPlayers = 4;
   }
 
-  const turnRanges = extractTurnRanges(rawLog);
-  const lines = rawLog.replace(/\r\n/g, '\n').split('\n');
-  const result: Record<number, TurnManaInfo> = {};
+  const manaPerTurn: Record<number, TurnManaInfo> = {};
+  const cardsDrawnPerTurn: Record<number, number> = {};
 
   for (const tr of turnRanges) {
     const round = Math.ceil(tr.turnNumber / numPlayers);
     let manaEvents = 0;
-
-    for (let i = tr.startIndex; i <= tr.endIndex && i < lines.length; i++) {
-      if (ExtractManaProduced.test(lines[i]) || ExtractTapFor.test(lines[i])) {
-        manaEvents++;
-      }
-    }
-
-    if (result[round]) {
-      result[round].manaEvents += manaEvents;
-    } else {
-      result[round] = { manaEvents };
-    }
-  }
-
-  return result;
-}
-
-function calculateCardsDrawnPerTurn(
-  rawLog: string,
-  numPlayers: number
-): Record<number, number> {
-  if (numPlayers === 0) {
-    numPlayers = 4;
-  }
-
-  const turnRanges = extractTurnRanges(rawLog);
-  const lines = rawLog.replace(/\r\n/g, '\n').split('\n');
-  const result: Record<number, number> = {};
-
-  for (const tr of turnRanges) {
-    const round = Math.ceil(tr.turnNumber / numPlayers);
     let cardsDrawn = 0;
 
     for (let i = tr.startIndex; i <= tr.endIndex && i < lines.length; i++) {
       const line = lines[i];
+      if (ExtractManaProduced.test(line) || ExtractTapFor.test(line)) {
+        manaEvents++;
+      }
       // Check for multiple draws: "draws N cards"
       const multiMatches = ExtractDrawMultiple.exec(line);
       if (multiMatches && multiMatches.length > 1) {
@@ -369,10 +345,15 @@ function calculateCardsDrawnPerTurn(
       }
     }
 
-    result[round] = (result[round] || 0) + cardsDrawn;
+    if (manaPerTurn[round]) {
+      manaPerTurn[round].manaEvents += manaEvents;
+    } else {
+      manaPerTurn[round] = { manaEvents };
+    }
+    cardsDrawnPerTurn[round] = (cardsDrawnPerTurn[round] || 0) + cardsDrawn;
   }
 
-  return result;
+  return { manaPerTurn, cardsDrawnPerTurn };
 }
 
 export function extractWinner(rawLog: string): string {
@@ -406,8 +387,10 @@ function calculatePerDeckTurns(ranges: TurnRange[]): Record<string, { turnsTaken
   return result;
 }
 
-export function extractWinningTurn(rawLog: string): number {
-  const turnRanges = extractTurnRanges(rawLog);
+export function extractWinningTurn(
+  rawLog: string,
+  turnRanges: TurnRange[] = extractTurnRanges(rawLog)
+): number {
   if (turnRanges.length === 0) return 0;
 
   const perDeck = calculatePerDeckTurns(turnRanges);
@@ -433,8 +416,10 @@ export function extractWinningTurn(rawLog: string): number {
  * Condense a single raw game log into a structured summary
  */
 export function condenseGame(rawLog: string): CondensedGame {
+  const lines = rawLog.replace(/\r\n/g, '\n').split('\n');
+
   // Step 1: Filter
-  const filteredLines = splitAndFilter(rawLog);
+  const filteredLines = filterLines(lines);
 
   // Step 2: Classify
   const keptEvents = classifyLines(filteredLines);
@@ -443,12 +428,11 @@ export function condenseGame(rawLog: string): CondensedGame {
   const turnRanges = extractTurnRanges(rawLog);
   const numPlayers = getNumPlayers(turnRanges);
   const turnCount = getMaxRound(turnRanges, numPlayers);
-  const manaPerTurn = calculateManaPerTurn(rawLog, numPlayers);
-  const cardsDrawnPerTurn = calculateCardsDrawnPerTurn(rawLog, numPlayers);
+  const { manaPerTurn, cardsDrawnPerTurn } = calculateTurnMetrics(lines, turnRanges, numPlayers);
 
   // Step 4: Detect winner
   const winner = extractWinner(rawLog);
-  const winningTurn = extractWinningTurn(rawLog);
+  const winningTurn = extractWinningTurn(rawLog, turnRanges);
 
   // Step 5: Build output
   const condensed: CondensedGame = {